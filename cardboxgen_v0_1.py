@@ -35,10 +35,13 @@ Notes:
 from __future__ import annotations
 
 import argparse
+import functools
+import io
 import json
 import math
+import operator
 import textwrap
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Dict, Iterable, List, Optional, Tuple
 
 __version__ = "0.6"
@@ -46,8 +49,27 @@ __version__ = "0.6"
 Point = Tuple[float, float]
 
 
+# Decimal places for SVG coordinates (0.001 mm by default); change via set_svg_precision().
+SVG_PRECISION = 3
+_FMT_SPEC = ".3f"
+
+
+@functools.lru_cache(maxsize=4096)
 def fmt(n: float) -> str:
-    return f"{n:.3f}".rstrip("0").rstrip(".")
+    # Whole numbers (rect corners, integer pitches) skip float formatting entirely;
+    # n // 1 is NaN for inf/nan, so those still fall through to the format path.
+    if n == n // 1:
+        return str(int(n))
+    return format(n, _FMT_SPEC).rstrip("0").rstrip(".")
+
+
+def set_svg_precision(digits: int) -> None:
+    """Set the number of decimals `fmt` emits (at least 1) and drop cached strings."""
+
+    global SVG_PRECISION, _FMT_SPEC
+    SVG_PRECISION = max(1, int(digits))
+    _FMT_SPEC = f".{SVG_PRECISION}f"
+    fmt.cache_clear()
 
 
 def add(p: Point, q: Point) -> Point:
@@ -66,17 +88,66 @@ def dot(p: Point, q: Point) -> float:
     return p[0] * q[0] + p[1] * q[1]
 
 
-def polyline_to_path(points: List[Point], close: bool = True) -> str:
-    if not points:
+def polyline_to_path(points: Iterable[Point], close: bool = True) -> str:
+    # Accepts any iterable of (x, y) pairs (lists, tuples, generators, tolist() output);
+    # the points are consumed in a single pass.
+    f = fmt
+    it = iter(points)
+    first = next(it, None)
+    if first is None:
         return ""
-    d = [f"M {fmt(points[0][0])} {fmt(points[0][1])}"]
-    for x, y in points[1:]:
-        d.append(f"L {fmt(x)} {fmt(y)}")
+    x, y = first
+    d = [f"M {f(x)} {f(y)}"]
+    d += ["L %s %s" % (f(x), f(y)) for x, y in it]
     if close:
         d.append("Z")
     return " ".join(d)
 
 
+def polyline_to_path_compact(points: Iterable[Point], close: bool = True) -> str:
+    """Like `polyline_to_path`, but uses H/V for axis-aligned segments.
+
+    Coordinates are compared after formatting, so the shorthand follows the SVG
+    precision. Segments that format to the current point are dropped, and a
+    straight H/V run through intermediate vertices (finger baselines) is merged.
+    """
+
+    f = fmt
+    it = iter(points)
+    first = next(it, None)
+    if first is None:
+        return ""
+    lx, ly = f(first[0]), f(first[1])
+    px, py = first
+    d = ["M %s %s" % (lx, ly)]
+    append = d.append
+    run = None  # (axis, direction) of the last H/V command, if it may be extended
+    for x, y in it:
+        sx, sy = f(x), f(y)
+        if sx == lx:
+            if sy == ly:
+                continue
+            key = ("V", y > py)
+            if key == run:
+                d[-1] = "V " + sy
+            else:
+                append("V " + sy)
+        elif sy == ly:
+            key = ("H", x > px)
+            if key == run:
+                d[-1] = "H " + sx
+            else:
+                append("H " + sx)
+        else:
+            key = None
+            append("L %s %s" % (sx, sy))
+        run = key
+        lx, ly, px, py = sx, sy, x, y
+    if close:
+        append("Z")
+    return " ".join(d)
+
+
 def polygon_to_path_with_tabs(points: List[Point], *, tab_width_mm: float) -> str:
     """Render a polygon as an SVG path but with a small gap (holding tab) per edge.
 
@@ -98,71 +169,89 @@ def polygon_to_path_with_tabs(points: List[Point], *, tab_width_mm: float) -> st
     if ring[0] != ring[-1]:
         ring.append(ring[0])
 
+    # Per-edge constants hoisted; each edge is handled with plain float locals.
+    f = fmt
+    short_edge = tab * 2 + 0.5
+    half_tab = tab / 2
     cmds: List[str] = []
-    cmds.append(f"M {fmt(ring[0][0])} {fmt(ring[0][1])}")
+    append = cmds.append
+    append(f"M {f(ring[0][0])} {f(ring[0][1])}")
 
     pen_down = True
-    for p0, p1 in zip(ring, ring[1:]):
-        dx = p1[0] - p0[0]
-        dy = p1[1] - p0[1]
-        if abs(dx) > 1e-9 and abs(dy) > 1e-9:
+    for (x0, y0), (x1, y1) in zip(ring, ring[1:]):
+        dx = x1 - x0
+        dy = y1 - y0
+        adx = abs(dx)
+        ady = abs(dy)
+        if adx > 1e-9 and ady > 1e-9:
             # Not axis-aligned; fall back to closed.
             return polyline_to_path(points, close=True)
 
-        length = abs(dx) + abs(dy)
+        length = adx + ady
         if length <= 1e-9:
             continue
 
-        if length <= tab * 2 + 0.5:
+        if not pen_down:
+            append(f"M {f(x0)} {f(y0)}")
+            pen_down = True
+
+        if length <= short_edge:
             # Too short to tab safely; cut the full edge.
-            if not pen_down:
-                cmds.append(f"M {fmt(p0[0])} {fmt(p0[1])}")
-                pen_down = True
-            cmds.append(f"L {fmt(p1[0])} {fmt(p1[1])}")
+            append(f"L {f(x1)} {f(y1)}")
             continue
 
         # Leave a gap centered on the edge.
-        ux = 0.0 if abs(dx) < 1e-9 else (1.0 if dx > 0 else -1.0)
-        uy = 0.0 if abs(dy) < 1e-9 else (1.0 if dy > 0 else -1.0)
-        gap0 = length / 2 - tab / 2
-        gap1 = length / 2 + tab / 2
-
-        cut_end = (p0[0] + ux * gap0, p0[1] + uy * gap0)
-        resume = (p0[0] + ux * gap1, p0[1] + uy * gap1)
-
-        if not pen_down:
-            cmds.append(f"M {fmt(p0[0])} {fmt(p0[1])}")
-            pen_down = True
-        cmds.append(f"L {fmt(cut_end[0])} {fmt(cut_end[1])}")
+        ux = 0.0 if adx < 1e-9 else (1.0 if dx > 0 else -1.0)
+        uy = 0.0 if ady < 1e-9 else (1.0 if dy > 0 else -1.0)
+        gap0 = length / 2 - half_tab
+        gap1 = length / 2 + half_tab
 
-        cmds.append(f"M {fmt(resume[0])} {fmt(resume[1])}")
-        pen_down = True
-        cmds.append(f"L {fmt(p1[0])} {fmt(p1[1])}")
+        append(f"L {f(x0 + ux * gap0)} {f(y0 + uy * gap0)}")
+        append(f"M {f(x0 + ux * gap1)} {f(y0 + uy * gap1)}")
+        append(f"L {f(x1)} {f(y1)}")
 
     return " ".join(cmds)
 
 
 def bbox_points(points: List[Point]) -> Tuple[float, float, float, float]:
-    xs = [p[0] for p in points]
-    ys = [p[1] for p in points]
+    # zip(*points) splits into per-axis tuples (structure of arrays) in C.
+    xs, ys = zip(*points)
     return (min(xs), min(ys), max(xs), max(ys))
 
 
 def polygon_area(points: List[Point]) -> float:
     if len(points) < 3:
         return 0.0
-    a = 0.0
-    for (x0, y0), (x1, y1) in zip(points, points[1:] + [points[0]]):
-        a += x0 * y1 - x1 * y0
-    return 0.5 * a
+    # Shoelace over per-axis tuples (structure-of-arrays); the rotated tuples supply the
+    # wrap-around vertex, and both cross-product sums run in C via map(operator.mul).
+    xs, ys = zip(*points)
+    mul = operator.mul
+    return 0.5 * (sum(map(mul, xs, ys[1:] + ys[:1])) - sum(map(mul, xs[1:] + xs[:1], ys)))
 
 
 def translate_points(points: List[Point], dx: float, dy: float) -> List[Point]:
     return [(x + dx, y + dy) for x, y in points]
 
 
+def translate_panel(panel: Panel, dx: float, dy: float) -> Panel:
+    """Shift a panel's outline, point cutouts and labels in place (one pass each)."""
+
+    panel.outline = translate_points(panel.outline, dx, dy)
+    for cut in panel.cutouts:
+        if cut.points is not None:
+            cut.points = translate_points(cut.points, dx, dy)
+    if panel.labels:
+        panel.labels = [(txt, (lx + dx, ly + dy)) for txt, (lx, ly) in panel.labels]
+    return panel
+
+
+# Edge directions are only ever the four axis unit vectors, so normals are a table lookup.
+# (1.0, 0.0) hashes like (1, 0), so float-typed directions hit the same entries.
+_NORMALS: Dict[Point, Point] = {(1, 0): (0, -1), (-1, 0): (0, 1), (0, 1): (1, 0), (0, -1): (-1, 0)}
+
+
 def is_axis_aligned_dir(v: Point) -> bool:
-    return (v[0] == 0 and abs(v[1]) == 1) or (v[1] == 0 and abs(v[0]) == 1)
+    return v in _NORMALS
 
 
 def outward_normal_for_edge(dirv: Point) -> Point:
@@ -171,6 +260,9 @@ def outward_normal_for_edge(dirv: Point) -> Point:
     For direction (dx,dy), outward is (dy, -dx).
     """
 
+    n = _NORMALS.get(dirv)
+    if n is not None:
+        return n
     dx, dy = dirv
     return (dy, -dx)
 
@@ -205,17 +297,24 @@ class EdgeKey:
     edge: str
 
 
-@dataclass
+@dataclass(frozen=True)
 class FingerPlan:
     length: float
     count: int
-    widths: List[float]
+    widths: Tuple[float, ...]
     start_with_tab_on_a: bool
+    # Alternating tab pattern for side A, fixed at construction (plans are frozen and shared).
+    tabs_mask: Tuple[bool, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        first = 0 if self.start_with_tab_on_a else 1
+        object.__setattr__(self, "tabs_mask", tuple(i % 2 == first for i in range(self.count)))
 
-    def tabs_mask_for_a(self) -> List[bool]:
-        return [((i % 2 == 0) if self.start_with_tab_on_a else (i % 2 == 1)) for i in range(self.count)]
+    def tabs_mask_for_a(self) -> Tuple[bool, ...]:
+        return self.tabs_mask
 
 
+@functools.lru_cache(maxsize=256)
 def compute_finger_count(
     length: float,
     target_finger_w: float,
@@ -239,6 +338,9 @@ def compute_finger_count(
     return n
 
 
+# Mating edges and lid edges repeat the same (length, count, ...) inputs, so plans are
+# memoized; FingerPlan is frozen (widths is a tuple) so one instance can be shared.
+@functools.lru_cache(maxsize=256)
 def build_finger_plan(
     length: float,
     *,
@@ -253,7 +355,7 @@ def build_finger_plan(
     pitch = length / count
     widths = [pitch] * count
     widths[-1] += (length - sum(widths))
-    return FingerPlan(length=length, count=count, widths=widths, start_with_tab_on_a=start_with_tab_on_a)
+    return FingerPlan(length=length, count=count, widths=tuple(widths), start_with_tab_on_a=start_with_tab_on_a)
 
 
 def finger_edge_points(
@@ -266,39 +368,49 @@ def finger_edge_points(
     kerf_mm: float,
     clearance_mm: float,
     invert_tabs: bool,
+    depths: Optional[Tuple[float, float]] = None,
 ) -> List[Point]:
     """Generate a Manhattan polyline along an edge using a FingerPlan.
 
     Returns points excluding the `start` point (so callers can stitch edges).
     The returned sequence ends on the baseline endpoint.
+    `depths` is a precomputed `joint_depths_drawn(...)` result for callers that
+    draw many edges with the same joint parameters.
     """
 
     if plan.length <= 0:
         return []
-    if not is_axis_aligned_dir(dirv) or not is_axis_aligned_dir(normal_out):
+    if dirv not in _NORMALS or normal_out not in _NORMALS:
         raise ValueError("dirv/normal must be axis-aligned")
-    if abs(dot(dirv, normal_out)) > 1e-9:
+    # Two axis unit vectors are perpendicular iff exactly one of them has a zero x.
+    if (dirv[0] == 0) == (normal_out[0] == 0):
         raise ValueError("dirv and normal must be perpendicular")
 
-    tab_depth, slot_depth = joint_depths_drawn(thickness=thickness, kerf_mm=kerf_mm, clearance_mm=clearance_mm)
+    if depths is None:
+        depths = joint_depths_drawn(thickness=thickness, kerf_mm=kerf_mm, clearance_mm=clearance_mm)
+    tab_depth, slot_depth = depths
+
+    # Per-axis scalars hoisted out of the loop: both offsets are constant per edge, so
+    # each finger is three adds per axis with no add/mul helper calls.
+    dx, dy = dirv
+    nx, ny = normal_out
+    tab_off = (nx * tab_depth, ny * tab_depth)
+    slot_off = (nx * -slot_depth, ny * -slot_depth)
+    # Signed offsets indexed by the (bool) mask entry; inversion just swaps the pair,
+    # so the loop selects an offset without branching on tab/slot or invert_tabs.
+    offsets = (tab_off, slot_off) if invert_tabs else (slot_off, tab_off)
 
-    tabs_a = plan.tabs_mask_for_a()
     pts: List[Point] = []
-    p = start
-    for i, w in enumerate(plan.widths):
-        is_tab = tabs_a[i]
-        if invert_tabs:
-            is_tab = not is_tab
-        depth = tab_depth if is_tab else slot_depth
-        off = mul(normal_out, depth if is_tab else -depth)
-        p_out = add(p, off)
-        p2 = add(p, mul(dirv, w))
-        p2_out = add(p2, off)
-
-        pts.append(p_out)
-        pts.append(p2_out)
-        pts.append(p2)
-        p = p2
+    append = pts.append
+    px, py = start
+    for w, is_tab in zip(plan.widths, plan.tabs_mask):
+        ox, oy = offsets[is_tab]
+        qx = px + dx * w
+        qy = py + dy * w
+        append((px + ox, py + oy))
+        append((qx + ox, qy + oy))
+        append((qx, qy))
+        px, py = qx, qy
     return pts
 
 
@@ -326,12 +438,35 @@ class Panel:
     outline: List[Point]
     cutouts: List[CutPath] = field(default_factory=list)
     labels: List[Tuple[str, Point]] = field(default_factory=list)
+    _bbox_cache: Optional[Tuple[List[Point], Tuple[float, float, float, float]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def bbox_full(self) -> Tuple[float, float, float, float]:
+        """(x0, y0, x1, y1) of the outline, cached until `outline` is reassigned."""
+        c = self._bbox_cache
+        if c is None or c[0] is not self.outline:
+            c = (self.outline, bbox_points(self.outline))
+            self._bbox_cache = c
+        return c[1]
 
     def bbox(self) -> Tuple[float, float]:
-        x0, y0, x1, y1 = bbox_points(self.outline)
+        x0, y0, x1, y1 = self.bbox_full
         return (x1 - x0, y1 - y0)
 
 
+# Path templates for the rounded cutouts; only the coordinates change per call.
+_WINDOW_TPL = (
+    "M %s %s L %s %s "
+    "A %s %s 0 0 1 %s %s L %s %s "
+    "A %s %s 0 0 1 %s %s L %s %s "
+    "A %s %s 0 0 1 %s %s L %s %s "
+    "A %s %s 0 0 1 %s %s Z"
+)
+_THUMB_TPL = "M %s %s L %s %s A %s %s 0 0 0 %s %s L %s %s Z"
+
+
 def make_window_cutout(w: float, h: float, margin: float, corner_r: float = 0.0) -> CutPath:
     x = margin
     y = margin
@@ -341,16 +476,15 @@ def make_window_cutout(w: float, h: float, margin: float, corner_r: float = 0.0)
         pts = [(x, y), (x + ww, y), (x + ww, y + hh), (x, y + hh)]
         return CutPath(points=pts)
     r = min(corner_r, ww / 2, hh / 2)
-    d = (
-        f"M {fmt(x + r)} {fmt(y)} "
-        f"L {fmt(x + ww - r)} {fmt(y)} "
-        f"A {fmt(r)} {fmt(r)} 0 0 1 {fmt(x + ww)} {fmt(y + r)} "
-        f"L {fmt(x + ww)} {fmt(y + hh - r)} "
-        f"A {fmt(r)} {fmt(r)} 0 0 1 {fmt(x + ww - r)} {fmt(y + hh)} "
-        f"L {fmt(x + r)} {fmt(y + hh)} "
-        f"A {fmt(r)} {fmt(r)} 0 0 1 {fmt(x)} {fmt(y + hh - r)} "
-        f"L {fmt(x)} {fmt(y + r)} "
-        f"A {fmt(r)} {fmt(r)} 0 0 1 {fmt(x + r)} {fmt(y)} Z"
+    fr = fmt(r)
+    fx0, fx1, fx2, fx3 = fmt(x), fmt(x + r), fmt(x + ww - r), fmt(x + ww)
+    fy0, fy1, fy2, fy3 = fmt(y), fmt(y + r), fmt(y + hh - r), fmt(y + hh)
+    d = _WINDOW_TPL % (
+        fx1, fy0, fx2, fy0,
+        fr, fr, fx3, fy1, fx3, fy2,
+        fr, fr, fx2, fy3, fx1, fy3,
+        fr, fr, fx0, fy2, fx0, fy1,
+        fr, fr, fx1, fy0,
     )
     return CutPath(d=d)
 
@@ -361,12 +495,8 @@ def make_thumb_notch(w: float, y_top: float, radius: float, depth: float) -> Cut
     x1 = cx + radius
     y0 = y_top
     y1 = y_top + depth
-    d = (
-        f"M {fmt(x0)} {fmt(y0)} "
-        f"L {fmt(x0)} {fmt(y1)} "
-        f"A {fmt(radius)} {fmt(radius)} 0 0 0 {fmt(x1)} {fmt(y1)} "
-        f"L {fmt(x1)} {fmt(y0)} Z"
-    )
+    fx0, fx1, fy0, fy1, fr = fmt(x0), fmt(x1), fmt(y0), fmt(y1), fmt(radius)
+    d = _THUMB_TPL % (fx0, fy0, fx0, fy1, fr, fr, fx1, fy1, fx1, fy0)
     return CutPath(d=d)
 
 
@@ -433,7 +563,9 @@ def svg_footer() -> str:
     return "</svg>\n"
 
 
+@functools.lru_cache(maxsize=16)
 def svg_layer_styles(*, stroke_mm: float = 0.2) -> str:
+    # Constant per stroke width: per-panel exports reuse one style block.
     s = max(0.001, float(stroke_mm))
     return (
         "  <style>\n"
@@ -454,30 +586,109 @@ def try_import_pyclipper():
         return None
 
 
-def offset_polygon_pyclipper(points: List[Point], delta: float) -> Optional[List[Point]]:
-    pc = try_import_pyclipper()
-    if pc is None:
-        return None
-    if len(points) < 3:
+_OFFSET_SCALE = 1000.0
+
+
+def _round_half_away(v: float) -> int:
+    # Clipper's Round(): half away from zero (Python's round() is half-to-even).
+    return int(v - 0.5) if v < 0 else int(v + 0.5)
+
+
+def _offset_axis_rect(points: List[Point], delta: float):
+    """Miter-offset an axis-aligned 4-point rectangle without a clipper round-trip.
+
+    Mirrors what pyclipper returns for the same input: coordinates snapped to the
+    1/1000 mm integer grid, and the ring in clipper's fixed order (max-x/max-y
+    corner first, then -x, -y, +x), whatever the input's start vertex or winding.
+    Returns None when the offset collapses the rectangle, or NotImplemented when
+    the input is not such a rectangle (or delta is below one grid step), in which
+    case the caller falls back to pyclipper.
+    """
+
+    if len(points) != 4:
+        return NotImplemented
+    if not all(p0[0] == p1[0] or p0[1] == p1[1] for p0, p1 in zip(points, points[1:] + points[:1])):
+        return NotImplemented
+    scale = _OFFSET_SCALE
+    xs = sorted({int(round(x * scale)) for x, _ in points})
+    ys = sorted({int(round(y * scale)) for _, y in points})
+    d = delta * scale
+    if len(xs) != 2 or len(ys) != 2 or abs(d) < 1.0:
+        return NotImplemented
+    x0, x1 = _round_half_away(xs[0] - d), _round_half_away(xs[1] + d)
+    y0, y1 = _round_half_away(ys[0] - d), _round_half_away(ys[1] + d)
+    if x1 <= x0 or y1 <= y0:
         return None
-    scale = 1000.0
+    x0, x1, y0, y1 = x0 / scale, x1 / scale, y0 / scale, y1 / scale
+    return [(x1, y1), (x0, y1), (x0, y0), (x1, y0)]
+
+
+def _offset_polygon_clipper(pc, points: List[Point], delta: float) -> Optional[List[Point]]:
+    scale = _OFFSET_SCALE
     path = [(int(round(x * scale)), int(round(y * scale))) for x, y in points]
     co = pc.PyclipperOffset()
     co.AddPath(path, pc.JT_MITER, pc.ET_CLOSEDPOLYGON)
     res = co.Execute(delta * scale)
     if not res:
         return None
-    # choose the largest area result
+    # choose the largest area result (exact integer shoelace on the scaled coordinates)
     def area_i(poly):
-        a = 0
-        for (x0, y0), (x1, y1) in zip(poly, poly[1:] + poly[:1]):
-            a += x0 * y1 - x1 * y0
-        return abs(a)
+        xs, ys = zip(*poly)
+        return abs(sum(map(operator.mul, xs, ys[1:] + ys[:1])) - sum(map(operator.mul, xs[1:] + xs[:1], ys)))
 
-    best = max(res, key=area_i)
+    # The common case is a single offset ring: no area comparison needed.
+    best = res[0] if len(res) == 1 else max(res, key=area_i)
     return [(p[0] / scale, p[1] / scale) for p in best]
 
 
+def offset_polygon_pyclipper(points: List[Point], delta: float) -> Optional[List[Point]]:
+    pc = try_import_pyclipper()
+    if pc is None:
+        return None
+    if len(points) < 3:
+        return None
+    # Axis-aligned rectangles (most cutouts) are offset directly, in clipper's output order.
+    rect = _offset_axis_rect(points, delta)
+    if rect is not NotImplemented:
+        return rect
+    return _offset_polygon_clipper(pc, points, delta)
+
+
+# Per-element SVG line templates, filled with % so each line is one formatting call.
+_SVG_PANEL_OPEN = '    <g id="%s" transform="translate(%s,%s)">\n'
+_SVG_PATH = '      <path d="%s"/>\n'
+_SVG_LABEL = '    <text x="%s" y="%s" text-anchor="middle" dominant-baseline="middle">%s</text>\n'
+
+
+@dataclass(frozen=True)
+class SvgRenderOptions:
+    """Layout and rendering settings for `render_svg` (the keyword arguments of `make_svg`)."""
+
+    sheet_width: float
+    labels: bool
+    offset_kerf: bool
+    kerf_mm: float
+    layout_margin_mm: float = 10.0
+    layout_padding_mm: float = 12.0
+    stroke_mm: float = 0.2
+    holding_tabs: bool = False
+    tab_width_mm: float = 2.0
+
+    @classmethod
+    def from_params(cls, p: BoxParams) -> SvgRenderOptions:
+        return cls(
+            sheet_width=p.sheet_width,
+            labels=p.labels,
+            offset_kerf=p.offset_kerf,
+            kerf_mm=p.kerf_mm,
+            layout_margin_mm=p.layout_margin_mm,
+            layout_padding_mm=p.layout_padding_mm,
+            stroke_mm=p.stroke_mm,
+            holding_tabs=p.holding_tabs,
+            tab_width_mm=p.tab_width_mm,
+        )
+
+
 def make_svg(
     panels: List[Panel],
     *,
@@ -491,20 +702,52 @@ def make_svg(
     stroke_mm: float = 0.2,
     holding_tabs: bool = False,
     tab_width_mm: float = 2.0,
-) -> str:
+    out_stream=None,
+) -> Optional[str]:
+    """Render the laid-out panels as one SVG document.
+
+    Returns the document as a string, or, when `out_stream` (any text file-like
+    object) is given, writes it there incrementally and returns None.
+    """
+    options = SvgRenderOptions(
+        sheet_width=sheet_width,
+        labels=labels,
+        offset_kerf=offset_kerf,
+        kerf_mm=kerf_mm,
+        layout_margin_mm=layout_margin_mm,
+        layout_padding_mm=layout_padding_mm,
+        stroke_mm=stroke_mm,
+        holding_tabs=holding_tabs,
+        tab_width_mm=tab_width_mm,
+    )
+    return render_svg(panels, meta=meta, options=options, out_stream=out_stream)
+
+
+def render_svg(panels: List[Panel], *, meta: dict, options: SvgRenderOptions, out_stream=None) -> Optional[str]:
+    """`make_svg` with its settings packed into one `SvgRenderOptions`."""
+    labels = options.labels
+    offset_kerf = options.offset_kerf
+    kerf_mm = options.kerf_mm
+    stroke_mm = options.stroke_mm
+    holding_tabs = options.holding_tabs
+    tab_width_mm = options.tab_width_mm
     placed, W, H = arrange_panels(
         panels,
-        sheet_width=sheet_width,
-        margin=float(layout_margin_mm),
-        gap=float(layout_padding_mm),
+        sheet_width=options.sheet_width,
+        margin=float(options.layout_margin_mm),
+        gap=float(options.layout_padding_mm),
     )
     meta_comment = "\n".join(textwrap.wrap(json.dumps(meta, ensure_ascii=False), width=120))
-    out: List[str] = [svg_header(W, H), svg_layer_styles(stroke_mm=stroke_mm)]
-    out.append(f"  <!-- params: {meta_comment} -->\n")
+    buf = io.StringIO() if out_stream is None else None
+    out = buf if buf is not None else out_stream
+    w = out.write
+    w(svg_header(W, H))
+    w(svg_layer_styles(stroke_mm=stroke_mm))
+    w(f"  <!-- params: {meta_comment} -->\n")
 
     label_items: List[Tuple[str, float, float]] = []
 
-    out.append('  <g id="CUT" class="cut">\n')
+    w('  <g id="CUT" class="cut">\n')
     for p, x, y in placed:
         outline_pts = p.outline
         if offset_kerf:
@@ -513,17 +756,16 @@ def make_svg(
                 outline_pts = off
 
         # Compensate for outlines that extend into negative coordinates due to finger protrusions.
-        minx, miny, _, _ = bbox_points(outline_pts)
+        # The unoffset outline's bbox was already computed (and cached) during layout.
+        minx, miny, _, _ = p.bbox_full if outline_pts is p.outline else bbox_points(outline_pts)
         gx = x - minx
         gy = y - miny
-        out.append(f'    <g id="{p.name}" transform="translate({fmt(gx)},{fmt(gy)})">\n')
+        w(_SVG_PANEL_OPEN % (p.name, fmt(gx), fmt(gy)))
 
         if holding_tabs:
-            out.append(
-                f'      <path d="{polygon_to_path_with_tabs(outline_pts, tab_width_mm=tab_width_mm)}"/>\n'
-            )
+            w(_SVG_PATH % polygon_to_path_with_tabs(outline_pts, tab_width_mm=tab_width_mm))
         else:
-            out.append(f'      <path d="{polyline_to_path(outline_pts, close=True)}"/>\n')
+            w(_SVG_PATH % polyline_to_path(outline_pts, close=True))
         for c in p.cutouts:
             if c.points is not None:
                 pts = c.points
@@ -532,27 +774,24 @@ def make_svg(
                     if off is not None:
                         pts = off
                 if holding_tabs:
-                    out.append(
-                        f'      <path d="{polygon_to_path_with_tabs(pts, tab_width_mm=tab_width_mm)}"/>\n'
-                    )
+                    w(_SVG_PATH % polygon_to_path_with_tabs(pts, tab_width_mm=tab_width_mm))
                 else:
-                    out.append(f'      <path d="{polyline_to_path(pts, close=True)}"/>\n')
+                    w(_SVG_PATH % polyline_to_path(pts, close=True))
             else:
-                out.append(f'      <path d="{c.to_svg_d()}"/>\n')
-        out.append("    </g>\n")
+                w(_SVG_PATH % c.to_svg_d())
+        w("    </g>\n")
 
         if labels:
             for txt, (tx, ty) in p.labels:
                 label_items.append((txt, gx + tx, gy + ty))
-    out.append("  </g>\n")
+    w("  </g>\n")
 
     if labels and label_items:
-        out.append('  <g id="ENGRAVE" class="text">\n')
-        for txt, lx, ly in label_items:
-            out.append(f'    <text x="{fmt(lx)}" y="{fmt(ly)}" text-anchor="middle" dominant-baseline="middle">{txt}</text>\n')
-        out.append("  </g>\n")
-    out.append(svg_footer())
-    return "".join(out)
+        w('  <g id="ENGRAVE" class="text">\n')
+        out.writelines(_SVG_LABEL % (fmt(lx), fmt(ly), txt) for txt, lx, ly in label_items)
+        w("  </g>\n")
+    w(svg_footer())
+    return buf.getvalue() if buf is not None else None
 
 
 @dataclass
@@ -712,6 +951,16 @@ class PanelSpec:
     edges: List[PanelEdge]
     cutouts: List[CutPath] = field(default_factory=list)
     labels: List[Tuple[str, Point]] = field(default_factory=list)
+    edge_index: Dict[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.edge_index = {e.name: i for i, e in enumerate(self.edges)}
+
+    def edge(self, name: str) -> PanelEdge:
+        i = self.edge_index.get(name)
+        if i is None:
+            raise KeyError(f"edge not found: {self.name}.{name}")
+        return self.edges[i]
 
 
 def build_rect_panel_spec(name: str, w: float, h: float) -> PanelSpec:
@@ -729,36 +978,56 @@ def build_rect_panel_spec(name: str, w: float, h: float) -> PanelSpec:
 
 
 def render_panel_from_spec(spec: PanelSpec, *, joint_params: JointParams, edge_pairs: Dict[str, EdgePair]) -> Panel:
-    # Build clockwise outline by stitching edges.
-    pts: List[Point] = [spec.edges[0].start]
+    # Build clockwise outline by stitching edges (path writer closes), dropping
+    # consecutive duplicate vertices as they are appended rather than in a second pass.
+    thickness = joint_params.thickness
+    kerf_mm = joint_params.kerf_mm
+    clearance_mm = joint_params.clearance_mm
+    # Joint depths depend only on the joint parameters: compute them once per panel.
+    depths = joint_depths_drawn(thickness=thickness, kerf_mm=kerf_mm, clearance_mm=clearance_mm)
+    first = spec.edges[0].start
+    pts: List[Point] = [first]
+    append = pts.append
+    lx, ly = first
     for e in spec.edges:
         start = e.start
         dirv = e.dirv
-        normal = outward_normal_for_edge(dirv)
         if e.finger_pair_id is None:
-            end = add(start, mul(dirv, e.length))
-            pts.append(end)
-            continue
-        pair = edge_pairs[e.finger_pair_id]
-        seg_pts = finger_edge_points(
-            start,
-            dirv,
-            normal,
-            pair.plan,
-            thickness=joint_params.thickness,
-            kerf_mm=joint_params.kerf_mm,
-            clearance_mm=joint_params.clearance_mm,
-            invert_tabs=e.invert_tabs,
-        )
-        pts.extend(seg_pts)
+            seg_pts: Iterable[Point] = ((start[0] + dirv[0] * e.length, start[1] + dirv[1] * e.length),)
+        else:
+            seg_pts = finger_edge_points(
+                start,
+                dirv,
+                outward_normal_for_edge(dirv),
+                edge_pairs[e.finger_pair_id].plan,
+                thickness=thickness,
+                kerf_mm=kerf_mm,
+                clearance_mm=clearance_mm,
+                invert_tabs=e.invert_tabs,
+                depths=depths,
+            )
+        for p in seg_pts:
+            x, y = p
+            if abs(x - lx) > 1e-9 or abs(y - ly) > 1e-9:
+                append(p)
+                lx, ly = x, y
 
-    # Ensure closed-ish (path writer closes). Also drop consecutive duplicates.
-    compact: List[Point] = []
-    for p in pts:
-        if not compact or (abs(p[0] - compact[-1][0]) > 1e-9 or abs(p[1] - compact[-1][1]) > 1e-9):
-            compact.append(p)
+    return Panel(name=spec.name, outline=pts, cutouts=list(spec.cutouts), labels=list(spec.labels))
 
-    return Panel(name=spec.name, outline=compact, cutouts=list(spec.cutouts), labels=list(spec.labels))
+
+@functools.lru_cache(maxsize=256)
+def _edge_plan(
+    length: float,
+    target_finger_w: float,
+    min_fingers: int,
+    explicit: Optional[int],
+    kerf_mm: float,
+    clearance_mm: float,
+    start_with_tab_on_a: bool,
+) -> FingerPlan:
+    # One cache hit per edge pair; box and lid shells share plans for matching edges.
+    n = compute_finger_count(length, target_finger_w, min_fingers=min_fingers, explicit=explicit)
+    return build_finger_plan(length, count=n, kerf_mm=kerf_mm, clearance_mm=clearance_mm, start_with_tab_on_a=start_with_tab_on_a)
 
 
 def build_edge_pairs_for_box(
@@ -780,8 +1049,8 @@ def build_edge_pairs_for_box(
 
     def mk_pair(pid: str, family: str, a: EdgeKey, b: EdgeKey, length: float, start_with_tab_on_a: bool):
         explicit = joint.finger_count_outer if family == EdgeFamily.OUTER else joint.finger_count_vertical
-        n = compute_finger_count(length, joint.target_finger_w, min_fingers=joint.min_fingers, explicit=explicit)
-        plan = build_finger_plan(length, count=n, kerf_mm=joint.kerf_mm, clearance_mm=joint.clearance_mm, start_with_tab_on_a=start_with_tab_on_a)
+        plan = _edge_plan(length, joint.target_finger_w, joint.min_fingers, explicit,
+                          joint.kerf_mm, joint.clearance_mm, start_with_tab_on_a)
         pairs[pid] = EdgePair(id=pid, family=family, a=a, b=b, length=length, plan=plan)
 
     # Bottom-to-walls (outer) pairs.
@@ -800,7 +1069,22 @@ def build_edge_pairs_for_box(
     return pairs
 
 
+@dataclass
+class BoxBuild:
+    """Panels for a preset together with the joint data they were drawn from."""
+
+    panels: List[Panel]
+    edge_pairs: Dict[str, EdgePair]
+    joint: JointParams
+    front_h: float
+
+
 def build_panels_for_preset(p: BoxParams) -> List[Panel]:
+    return build_box_for_preset(p).panels
+
+
+def build_box_for_preset(p: BoxParams) -> BoxBuild:
+    """Like `build_panels_for_preset`, but also returns the shell edge pairs and joint."""
     t = p.thickness
     outer_w = p.inner_width + 2 * t
     outer_d = p.inner_depth + 2 * t
@@ -867,13 +1151,9 @@ def build_panels_for_preset(p: BoxParams) -> List[Panel]:
     # Assign finger pair ids to edges and invert flags so mates are complementary.
     # We keep the plan computed for "A" side; panel edges decide whether they are A or B.
     def bind(panel: str, edge: str, pid: str, *, invert: bool):
-        spec = specs[panel]
-        for e in spec.edges:
-            if e.name == edge:
-                e.finger_pair_id = pid
-                e.invert_tabs = invert
-                return
-        raise KeyError(f"edge not found: {panel}.{edge}")
+        e = specs[panel].edge(edge)
+        e.finger_pair_id = pid
+        e.invert_tabs = invert
 
     # Bottom/walls
     bind("BOTTOM", "top", "bottom_back", invert=False)
@@ -1065,16 +1345,9 @@ def build_panels_for_preset(p: BoxParams) -> List[Panel]:
         ]
         lid_map = {s.name: s for s in lid_specs}
 
-        # Pairing for lid: treat as a separate box shell with its own edge pairs.
-        lid_joint = JointParams(
-            thickness=t,
-            target_finger_w=target_finger_w,
-            min_fingers=p.min_fingers,
-            kerf_mm=p.kerf_mm,
-            clearance_mm=p.clearance_mm,
-            finger_count_outer=p.finger_count_outer,
-            finger_count_vertical=p.finger_count_vertical,
-        )
+        # Pairing for lid: treat as a separate box shell with its own edge pairs. The lid
+        # uses the same joint parameters as the box, so its plans come from the same cache.
+        lid_joint = joint
         lid_pairs = build_edge_pairs_for_box(
             joint=lid_joint,
             outer_w=lid_in_w,
@@ -1085,13 +1358,9 @@ def build_panels_for_preset(p: BoxParams) -> List[Panel]:
         )
 
         def bind_lid(panel: str, edge: str, pid: str, invert: bool):
-            spec = lid_map[panel]
-            for e in spec.edges:
-                if e.name == edge:
-                    e.finger_pair_id = pid
-                    e.invert_tabs = invert
-                    return
-            raise KeyError(f"edge not found: {panel}.{edge}")
+            e = lid_map[panel].edge(edge)
+            e.finger_pair_id = pid
+            e.invert_tabs = invert
 
         # Bottom in this helper is the lid top.
         bind_lid("LID_TOP", "top", "bottom_back", invert=False)
@@ -1119,7 +1388,7 @@ def build_panels_for_preset(p: BoxParams) -> List[Panel]:
 
         for nm in ("LID_TOP", "LID_BACK", "LID_FRONT", "LID_LEFT", "LID_RIGHT"):
             panels.append(render_panel_from_spec(lid_map[nm], joint_params=lid_joint, edge_pairs=lid_pairs))
-    return panels
+    return BoxBuild(panels=panels, edge_pairs=edge_pairs, joint=joint, front_h=front_h)
 
 
 def generate_svg_with_warnings(p: BoxParams) -> Tuple[str, List[str]]:
@@ -1129,56 +1398,14 @@ def generate_svg_with_warnings(p: BoxParams) -> Tuple[str, List[str]]:
       (svg_xml, warnings)
     """
 
-    panels = build_panels_for_preset(p)
-
-    # Rebuild edge pairs for warnings (same logic as build_panels_for_preset)
-    t = p.thickness
-    outer_w = p.inner_width + 2 * t
-    outer_d = p.inner_depth + 2 * t
-    wall_h = p.inner_height + t
-    target_finger_w = p.finger_width if p.finger_width is not None else max(10.0, 3.0 * t)
-    joint = JointParams(
-        thickness=t,
-        target_finger_w=target_finger_w,
-        min_fingers=p.min_fingers,
-        kerf_mm=p.kerf_mm,
-        clearance_mm=p.clearance_mm,
-        finger_count_outer=p.finger_count_outer,
-        finger_count_vertical=p.finger_count_vertical,
-    )
-    preset = p.preset
-    include_front = preset in ("dispenser_slot_front", "window_front", "tray_open_front", "box_with_lid")
-    front_h = p.front_height if p.front_height is not None else wall_h
-    if preset == "tray_open_front":
-        front_h = p.front_height if p.front_height is not None else max(t * 2, 0.55 * wall_h)
-    elif preset in ("dispenser_slot_front", "window_front", "box_with_lid"):
-        front_h = wall_h
-
-    edge_pairs = build_edge_pairs_for_box(
-        joint=joint,
-        outer_w=outer_w,
-        outer_d=outer_d,
-        wall_h=wall_h,
-        front_h=front_h,
-        include_front=include_front,
-    )
-    warnings = validate_params_and_pairs(p, edge_pairs)
+    # Warnings are computed from the edge pairs the panels were actually drawn with.
+    build = build_box_for_preset(p)
+    panels = build.panels
+    warnings = validate_params_and_pairs(p, build.edge_pairs)
 
     meta = p.__dict__.copy()
     meta["joint_rule"] = "drawn_slot = thickness + clearance - kerf (expected final slot ~ thickness + clearance)"
-    svg = make_svg(
-        panels,
-        meta=meta,
-        sheet_width=p.sheet_width,
-        labels=p.labels,
-        offset_kerf=p.offset_kerf,
-        kerf_mm=p.kerf_mm,
-        layout_margin_mm=p.layout_margin_mm,
-        layout_padding_mm=p.layout_padding_mm,
-        stroke_mm=p.stroke_mm,
-        holding_tabs=p.holding_tabs,
-        tab_width_mm=p.tab_width_mm,
-    )
+    svg = render_svg(panels, meta=meta, options=SvgRenderOptions.from_params(p))
     return svg, warnings
 
 
@@ -1211,10 +1438,12 @@ def build_calibration_svg(
 
     panels: List[Panel] = []
     y_cursor = 0.0
+    # Strip length and finger width are fixed, so every row shares one finger count;
+    # only the clearance varies (build_finger_plan is memoized on it).
+    n = compute_finger_count(length, joint.target_finger_w, min_fingers=joint.min_fingers, explicit=None)
     for label, c in items:
         joint.clearance_mm = c
-        n = compute_finger_count(length, joint.target_finger_w, min_fingers=joint.min_fingers, explicit=None)
-        plan = build_finger_plan(length, count=n, kerf_mm=joint.kerf_mm, clearance_mm=joint.clearance_mm, start_with_tab_on_a=True)
+        plan = build_finger_plan(length, count=n, kerf_mm=joint.kerf_mm, clearance_mm=c, start_with_tab_on_a=True)
 
         tab_d, slot_d = joint_depths_drawn(thickness=t, kerf_mm=joint.kerf_mm, clearance_mm=c)
         expected_final_slot = t + c
@@ -1249,21 +1478,8 @@ def build_calibration_svg(
         b = render_panel_from_spec(b_spec, joint_params=joint, edge_pairs=edge_pairs)
 
         # Translate into a single sheet arrangement (manual).
-        a.outline = translate_points(a.outline, 0.0, y_cursor)
-        for cut in a.cutouts:
-            if cut.points is not None:
-                cut.points = translate_points(cut.points, 0.0, y_cursor)
-        for i, (txt, (lx, ly)) in enumerate(a.labels):
-            a.labels[i] = (txt, (lx, ly + y_cursor))
-        panels.append(a)
-
-        b.outline = translate_points(b.outline, length + gap, y_cursor)
-        for cut in b.cutouts:
-            if cut.points is not None:
-                cut.points = translate_points(cut.points, length + gap, y_cursor)
-        for i, (txt, (lx, ly)) in enumerate(b.labels):
-            b.labels[i] = (txt, (lx + length + gap, ly + y_cursor))
-        panels.append(b)
+        panels.append(translate_panel(a, 0.0, y_cursor))
+        panels.append(translate_panel(b, length + gap, y_cursor))
 
         y_cursor += height + gap
 
@@ -1272,22 +1488,42 @@ def build_calibration_svg(
     height_total = y_cursor + 10
     meta = {"thickness": thickness, "kerf_mm": kerf_mm, "clearances": clearance_values}
 
-    out: List[str] = [svg_header(width, height_total), svg_layer_styles()]
     meta_comment = "\n".join(textwrap.wrap(json.dumps(meta, ensure_ascii=False), width=120))
-    out.append(f"  <!-- calibration: {meta_comment} -->\n")
-    out.append('  <g id="CUT" class="cut">\n')
-    for p in panels:
-        out.append(f'    <path d="{polyline_to_path(p.outline, close=True)}"/>\n')
-    out.append("  </g>\n")
-    out.append('  <g id="ENGRAVE" class="text">\n')
-    for p in panels:
-        for txt, (tx, ty) in p.labels:
-            out.append(f'    <text x="{fmt(tx)}" y="{fmt(ty)}" text-anchor="middle" dominant-baseline="middle">{txt}</text>\n')
-    out.append("  </g>\n")
-    out.append(svg_footer())
+    # Written straight to the file, like make_svg's out_stream path: no accumulator list.
+    with open(out_path, "w", encoding="utf-8") as f:
+        w = f.write
+        w(svg_header(width, height_total))
+        w(svg_layer_styles())
+        w(f"  <!-- calibration: {meta_comment} -->\n")
+        w('  <g id="CUT" class="cut">\n')
+        # Every strip shares the cut style (fill: none), so all outlines go into one
+        # path as closed subpaths instead of one <path> element per strip.
+        w('    <path d="%s"/>\n' % " ".join([polyline_to_path_compact(p.outline, close=True) for p in panels]))
+        w("  </g>\n")
+        w('  <g id="ENGRAVE" class="text">\n')
+        f.writelines([_SVG_LABEL % (fmt(tx), fmt(ty), txt) for p in panels for txt, (tx, ty) in p.labels])
+        w("  </g>\n")
+        w(svg_footer())
+
+
+def _write_panel_svg(panel: Panel, *, out_dir: str, meta: dict, options: SvgRenderOptions, precision: int = 3) -> str:
+    """Write one panel as its own SVG (per_panel_svgs export); module-level so worker processes can run it."""
+
+    import os
+
+    # Spawned workers start from the module default, so the precision travels with the job.
+    if precision != SVG_PRECISION:
+        set_svg_precision(precision)
 
+    out_path = os.path.join(out_dir, f"{panel.name}.svg")
     with open(out_path, "w", encoding="utf-8") as f:
-        f.write("".join(out))
+        render_svg(
+            [panel],
+            meta={**meta, "single_panel": panel.name},
+            options=replace(options, sheet_width=max(panel.bbox()[0] + 20, 50)),
+            out_stream=f,
+        )
+    return out_path
 
 
 def parse_args() -> argparse.Namespace:
@@ -1360,12 +1596,19 @@ def parse_args() -> argparse.Namespace:
     ap.add_argument("--margin-mm", type=float, default=10.0, help="Outer layout margin (mm)")
     ap.add_argument("--padding-mm", type=float, default=12.0, help="Spacing between parts in layout (mm)")
     ap.add_argument("--stroke-mm", type=float, default=0.2, help="SVG stroke width for CUT/SCORE/ENGRAVE (mm)")
+    ap.add_argument("--svg-precision", type=int, default=3, help="Decimals for SVG coordinates (default 3)")
     ap.add_argument("--export", choices=["single_svg", "per_panel_svgs"], default="single_svg")
+    ap.add_argument("--workers", type=int, default=1, help="Worker processes for per_panel_svgs export (default 1)")
     ap.add_argument("--offset-kerf", action="store_true", help="If pyclipper is installed, offset cut paths by kerf/2")
     ap.add_argument("--holding-tabs", action="store_true", help="Leave small uncut gaps (bridges) on polygon cuts")
     ap.add_argument("--tab-width", type=float, default=2.0, help="Holding tab width (mm), default 2.0")
 
     ap.add_argument("--no-labels", action="store_true")
+    ap.add_argument(
+        "--no-validate",
+        action="store_true",
+        help="Skip the degenerate-outline check on generated panels (geometry is deterministic)",
+    )
     ap.add_argument("--out", required=True, help="Output path (single SVG) or directory (per_panel_svgs)")
 
     ap.add_argument("--calibration", action="store_true", help="Generate calibration plate (mating strips)")
@@ -1386,6 +1629,7 @@ def parse_args() -> argparse.Namespace:
 
 def main():
     args = parse_args()
+    set_svg_precision(args.svg_precision)
 
     kerf_mm = args.kerf_mm if args.kerf_mm is not None else float(args.kerf)
     if args.clearance_mm is not None:
@@ -1458,54 +1702,35 @@ def main():
     )
 
     panels = build_panels_for_preset(p)
-    # Basic invariants
-    for panel in panels:
-        if len(panel.outline) < 4 or abs(polygon_area(panel.outline)) < 1e-6:
-            raise RuntimeError(f"Degenerate panel outline: {panel.name}")
+    # Basic invariants (on by default; the shoelace pass is the only full walk of every outline).
+    if not args.no_validate:
+        for panel in panels:
+            if len(panel.outline) < 4 or abs(polygon_area(panel.outline)) < 1e-6:
+                raise RuntimeError(f"Degenerate panel outline: {panel.name}")
 
     meta = p.__dict__.copy()
     meta["note"] = "Generated by deterministic edge-pair cardboxgen"
 
+    options = SvgRenderOptions.from_params(p)
     if p.export == "single_svg":
-        svg = make_svg(
-            panels,
-            meta=meta,
-            sheet_width=p.sheet_width,
-            labels=p.labels,
-            offset_kerf=p.offset_kerf,
-            kerf_mm=p.kerf_mm,
-            layout_margin_mm=p.layout_margin_mm,
-            layout_padding_mm=p.layout_padding_mm,
-            stroke_mm=p.stroke_mm,
-            holding_tabs=p.holding_tabs,
-            tab_width_mm=p.tab_width_mm,
-        )
         with open(args.out, "w", encoding="utf-8") as f:
-            f.write(svg)
+            render_svg(panels, meta=meta, options=options, out_stream=f)
         return
 
     # per_panel_svgs
     import os
 
     os.makedirs(args.out, exist_ok=True)
-    for panel in panels:
-        svg = make_svg(
-            [panel],
-            meta={**meta, "single_panel": panel.name},
-            sheet_width=max(panel.bbox()[0] + 20, 50),
-            labels=p.labels,
-            offset_kerf=p.offset_kerf,
-            kerf_mm=p.kerf_mm,
-            layout_margin_mm=p.layout_margin_mm,
-            layout_padding_mm=p.layout_padding_mm,
-            stroke_mm=p.stroke_mm,
-            holding_tabs=p.holding_tabs,
-            tab_width_mm=p.tab_width_mm,
-        )
-        out_path = os.path.join(args.out, f"{panel.name}.svg")
-        with open(out_path, "w", encoding="utf-8") as f:
-            f.write(svg)
+    job = functools.partial(_write_panel_svg, out_dir=args.out, meta=meta, options=options, precision=SVG_PRECISION)
+    if args.workers > 1 and len(panels) > 1:
+        # Imported lazily: only the CLI export needs worker processes (not available under Pyodide).
+        from concurrent.futures import ProcessPoolExecutor
 
+        with ProcessPoolExecutor(max_workers=min(args.workers, len(panels))) as ex:
+            list(ex.map(job, panels))
+    else:
+        for panel in panels:
+            job(panel)
 
 if __name__ == "__main__":
     main()
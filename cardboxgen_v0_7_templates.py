@@ -13,14 +13,30 @@ Outputs: laser-cut SVG (mm units) with labelled parts laid out.
 """
 from __future__ import annotations
 
-import argparse, json, math, textwrap
-from dataclasses import dataclass
-from typing import List, Tuple, Dict, Optional
+import argparse, copy, functools, io, json, math, os
+from dataclasses import dataclass, field
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 Point = Tuple[float, float]
+# Outlines are either (x, y) tuples or a flat array('d') of x0, y0, x1, y1, ...
+# (finger-jointed edges are accumulated flat to avoid one tuple per vertex).
+Outline = Union[Sequence[Point], array]
+
+@functools.lru_cache(maxsize=65536)
+def _fmt_int(k: int) -> str:
+    # k is the value in thousandths; coordinates repeat heavily, so cache the text.
+    q, r = divmod(abs(k), 1000)
+    sign = "-" if k < 0 else ""
+    if r == 0:
+        return f"{sign}{q}"
+    s = f"{sign}{q}.{r:03d}"
+    while s[-1] == "0":
+        s = s[:-1]
+    return s
 
 def fmt(n: float) -> str:
-    return f"{n:.3f}".rstrip("0").rstrip(".")
+    return _fmt_int(int(n * 1000 + (0.5 if n >= 0 else -0.5)))
 
 def add(p: Point, q: Point) -> Point:
     return (p[0] + q[0], p[1] + q[1])
@@ -28,86 +44,183 @@ def add(p: Point, q: Point) -> Point:
 def mul(p: Point, s: float) -> Point:
     return (p[0] * s, p[1] * s)
 
-def polyline_to_path(points: List[Point], close: bool = True) -> str:
+def write_polyline(write, points: Outline, close: bool = True) -> None:
+    """Write path data for a polyline straight into a text sink (e.g. StringIO.write)."""
     if not points:
-        return ""
-    d = [f"M {fmt(points[0][0])} {fmt(points[0][1])}"]
-    for x, y in points[1:]:
-        d.append(f"L {fmt(x)} {fmt(y)}")
+        return
+    if isinstance(points, array):
+        it = iter(points)
+        pairs = zip(it, it)
+    else:
+        if close and len(points) == 4:
+            (x0, y0), (x1, y1), (x2, y2), (x3, y3) = points
+            if y0 == y1 and x1 == x2 and y2 == y3 and x3 == x0:
+                # Axis-aligned rectangle: four formatted numbers instead of eight.
+                fx0, fy0, fx1, fy2 = fmt(x0), fmt(y0), fmt(x1), fmt(y2)
+                write(f"M {fx0} {fy0} L {fx1} {fy0} L {fx1} {fy2} L {fx0} {fy2} Z")
+                return
+        pairs = iter(points)
+    f = fmt
+    x, y = next(pairs)
+    write(f"M {f(x)} {f(y)}")
+    for x, y in pairs:
+        write(f" L {f(x)} {f(y)}")
     if close:
-        d.append("Z")
-    return " ".join(d)
+        write(" Z")
+
+def polyline_to_path(points: Outline, close: bool = True) -> str:
+    buf = io.StringIO()
+    write_polyline(buf.write, points, close)
+    return buf.getvalue()
 
 def edge_points(start: Point, dirv: Point, normal_out: Point, length: float, *,
-                jointed: bool, t: float, finger_w: float, phase: int) -> List[Point]:
+                jointed: bool, t: float, finger_w: float, phase: int) -> array:
+    """Edge vertices after `start`, as a flat array('d') of x, y pairs."""
     if length <= 0:
-        return []
+        return array("d")
     if not jointed:
-        return [add(start, mul(dirv, length))]
+        return array("d", add(start, mul(dirv, length)))
 
     n = max(3, int(round(length / max(1e-6, finger_w))))
     if n % 2 == 0:
         n += 1
     seg = length / n
 
-    pts: List[Point] = []
-    p = start
+    # Unrolled scalar form of add/mul: no helper calls or temporary tuples per finger.
+    dx, dy = dirv[0] * seg, dirv[1] * seg
+    nx, ny = normal_out[0] * t, normal_out[1] * t
+    px, py = start
+    out_off, in_off = (nx, ny), (-nx, -ny)
+    offs = (out_off, in_off) if phase % 2 == 0 else (in_off, out_off)
+    buf = array("d")
+    append = buf.append
     for i in range(n):
-        protrude = ((i + phase) % 2 == 0)
-        off = mul(normal_out, t if protrude else -t)
-        pts.append(add(p, off))
-        p = add(p, mul(dirv, seg))
-        pts.append(add(p, off))
-        pts.append(p)
-    return pts
+        ox, oy = offs[i & 1]
+        append(px + ox); append(py + oy)
+        px += dx
+        py += dy
+        append(px + ox); append(py + oy)
+        append(px); append(py)
+    return buf
+
+# Clockwise edges (top, right, bottom, left): start corner as (w?, h?) selectors,
+# direction, outward normal, runs along h. Joint flags and phases are passed as
+# 4-tuples in the same order.
+_RECT_EDGES = (
+    ((0, 0), (1, 0), (0, -1), False),
+    ((1, 0), (0, 1), (1, 0), True),
+    ((1, 1), (-1, 0), (0, 1), False),
+    ((0, 1), (0, -1), (-1, 0), True),
+)
+
+_ALL_JOINTED = (True, True, True, True)
+_OPEN_TOP = (False, True, True, True)
+_PHASES0 = (0, 0, 0, 0)
+_PHASES1 = (1, 1, 1, 1)
+
+# Mirrored parts (LEFT/RIGHT walls, etc.) request identical outlines, so the geometry
+# is memoized as an immutable tuple; callers get a fresh copy they are free to mutate.
+@functools.lru_cache(maxsize=128)
+def _rect_with_fingers_cached(w: float, h: float, t: float, finger_w: float,
+                              joints: Tuple[bool, bool, bool, bool],
+                              phases: Tuple[int, int, int, int]) -> Tuple[float, ...]:
+    pts = array("d", (0.0, 0.0))
+    for ((cx, cy), dirv, normal, vertical), jointed, phase in zip(_RECT_EDGES, joints, phases):
+        start = (w if cx else 0.0, h if cy else 0.0)
+        pts += edge_points(start, dirv, normal, h if vertical else w,
+                           jointed=jointed, t=t, finger_w=finger_w, phase=phase)
+    return tuple(pts)
 
 def rect_with_fingers(w: float, h: float, *, t: float, finger_w: float,
-                      joints: Dict[str, bool], phases: Dict[str, int]) -> List[Point]:
-    p0 = (0.0, 0.0)
-    pts = [p0]
-    pts += edge_points(p0, (1, 0), (0, -1), w, jointed=joints.get("top", False), t=t, finger_w=finger_w, phase=phases.get("top", 0))
-    p1 = (w, 0.0)
-    pts += edge_points(p1, (0, 1), (1, 0), h, jointed=joints.get("right", False), t=t, finger_w=finger_w, phase=phases.get("right", 0))
-    p2 = (w, h)
-    pts += edge_points(p2, (-1, 0), (0, 1), w, jointed=joints.get("bottom", False), t=t, finger_w=finger_w, phase=phases.get("bottom", 0))
-    p3 = (0.0, h)
-    pts += edge_points(p3, (0, -1), (-1, 0), h, jointed=joints.get("left", False), t=t, finger_w=finger_w, phase=phases.get("left", 0))
-    return pts
-
-def bbox_points(points: List[Point]) -> Tuple[float, float, float, float]:
-    xs = [p[0] for p in points]
-    ys = [p[1] for p in points]
+                      joints: Tuple[bool, bool, bool, bool], phases: Tuple[int, int, int, int]) -> Outline:
+    if not any(joints):
+        return [(0.0, 0.0), (w, 0.0), (w, h), (0.0, h)]
+    return array("d", _rect_with_fingers_cached(w, h, t, finger_w, joints, phases))
+
+def bbox_points(points: Outline) -> Tuple[float, float, float, float]:
+    if isinstance(points, array):
+        xs, ys = points[0::2], points[1::2]
+    else:
+        # zip(*points) transposes to per-axis tuples in C (no Python-level comprehension).
+        xs, ys = zip(*points)
     return (min(xs), min(ys), max(xs), max(ys))
 
-def panel_bbox(outline: List[Point]) -> Tuple[float, float]:
+def panel_bbox(outline: Outline) -> Tuple[float, float]:
     x0, y0, x1, y1 = bbox_points(outline)
     return (x1 - x0, y1 - y0)
 
+# Unit-circle vertex tables keyed by segment count; outlines only scale/offset these.
+_UNIT_CIRCLES: Dict[int, Tuple[Point, ...]] = {}
+
+def _unit_circle(segs: int) -> Tuple[Point, ...]:
+    pts = _UNIT_CIRCLES.get(segs)
+    if pts is None:
+        # Rotate by the step angle (addition formulas) instead of two trig calls per
+        # vertex; re-seed from cos/sin every 16 steps to keep rounding drift bounded.
+        step = math.tau / segs
+        dc, ds = math.cos(step), math.sin(step)
+        out = []
+        c, s = 1.0, 0.0
+        for i in range(segs):
+            if i & 15 == 0:
+                c, s = math.cos(step * i), math.sin(step * i)
+            out.append((c, s))
+            c, s = c * dc - s * ds, s * dc + c * ds
+        pts = tuple(out)
+        _UNIT_CIRCLES[segs] = pts
+    return pts
+
+for _segs in (48, 96, 192):
+    _unit_circle(_segs)
+
+# Path templates: each distinct coordinate is formatted once, then substituted in one % call.
+_RECT_TPL = "M %(x0)s %(y0)s L %(x1)s %(y0)s L %(x1)s %(y1)s L %(x0)s %(y1)s Z"
+_ROUNDED_RECT_TPL = (
+    "M %(xr)s %(y0)s "
+    "L %(xwr)s %(y0)s "
+    "A %(r)s %(r)s 0 0 1 %(x1)s %(yr)s "
+    "L %(x1)s %(yhr)s "
+    "A %(r)s %(r)s 0 0 1 %(xwr)s %(y1)s "
+    "L %(xr)s %(y1)s "
+    "A %(r)s %(r)s 0 0 1 %(x0)s %(yhr)s "
+    "L %(x0)s %(yr)s "
+    "A %(r)s %(r)s 0 0 1 %(xr)s %(y0)s Z"
+)
+_CIRCLE_TPL = "M %(xa)s %(cy)s A %(r)s %(r)s 0 1 0 %(xb)s %(cy)s A %(r)s %(r)s 0 1 0 %(xa)s %(cy)s Z"
+
 def rect_path(x: float, y: float, w: float, h: float) -> str:
-    return f"M {fmt(x)} {fmt(y)} L {fmt(x+w)} {fmt(y)} L {fmt(x+w)} {fmt(y+h)} L {fmt(x)} {fmt(y+h)} Z"
+    return _RECT_TPL % {"x0": fmt(x), "y0": fmt(y), "x1": fmt(x+w), "y1": fmt(y+h)}
 
 def rounded_rect_path(x: float, y: float, w: float, h: float, r: float) -> str:
     r = max(0.0, min(r, w/2, h/2))
     if r <= 0:
         return rect_path(x, y, w, h)
-    return (
-        f"M {fmt(x+r)} {fmt(y)} "
-        f"L {fmt(x+w-r)} {fmt(y)} "
-        f"A {fmt(r)} {fmt(r)} 0 0 1 {fmt(x+w)} {fmt(y+r)} "
-        f"L {fmt(x+w)} {fmt(y+h-r)} "
-        f"A {fmt(r)} {fmt(r)} 0 0 1 {fmt(x+w-r)} {fmt(y+h)} "
-        f"L {fmt(x+r)} {fmt(y+h)} "
-        f"A {fmt(r)} {fmt(r)} 0 0 1 {fmt(x)} {fmt(y+h-r)} "
-        f"L {fmt(x)} {fmt(y+r)} "
-        f"A {fmt(r)} {fmt(r)} 0 0 1 {fmt(x+r)} {fmt(y)} Z"
-    )
+    return _ROUNDED_RECT_TPL % {
+        "x0": fmt(x), "y0": fmt(y), "x1": fmt(x+w), "y1": fmt(y+h),
+        "xr": fmt(x+r), "xwr": fmt(x+w-r), "yr": fmt(y+r), "yhr": fmt(y+h-r), "r": fmt(r),
+    }
 
+# Axle, knob and screw holes repeat the same (cx, cy, r) across panels and rebuilds.
+# Keyed on the exact floats so a hit can never format differently from a miss;
+# distinct pocket centres go through circle_ring_paths and skip this cache.
+@functools.lru_cache(maxsize=256)
 def circle_path(cx: float, cy: float, r: float) -> str:
-    return (
-        f"M {fmt(cx+r)} {fmt(cy)} "
-        f"A {fmt(r)} {fmt(r)} 0 1 0 {fmt(cx-r)} {fmt(cy)} "
-        f"A {fmt(r)} {fmt(r)} 0 1 0 {fmt(cx+r)} {fmt(cy)} Z"
-    )
+    return _CIRCLE_TPL % {"xa": fmt(cx+r), "xb": fmt(cx-r), "cy": fmt(cy), "r": fmt(r)}
+
+@functools.lru_cache(maxsize=64)
+def circle_ring_paths(cx: float, cy: float, ring_r: float, r: float, count: int) -> Tuple[str, ...]:
+    """`count` equal circles of radius r evenly spaced on a ring (e.g. wheel pockets).
+
+    Memoized: regenerating with unchanged wheel parameters reuses the formatted paths.
+    """
+    f = fmt
+    fr = f(r)
+    out = []
+    for c, s in _unit_circle(count):
+        px = cx + ring_r * c
+        py = f(cy + ring_r * s)
+        out.append(_CIRCLE_TPL % {"xa": f(px + r), "xb": f(px - r), "cy": py, "r": fr})
+    return tuple(out)
 
 def thumb_notch_path(w: float, y_top: float, radius: float, depth: float) -> str:
     cx = w / 2
@@ -122,37 +235,65 @@ def thumb_notch_path(w: float, y_top: float, radius: float, depth: float) -> str
         f"L {fmt(x1)} {fmt(y0)} Z"
     )
 
-@dataclass
+@dataclass(slots=True)
 class Panel:
     name: str
-    outline: List[Point]
-    cutouts: List[str]
+    outline: Outline
+    cutouts: Sequence[str]
     labels: List[Tuple[str, Point]]
+    _bbox_wh: Optional[Tuple[float, float]] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def bbox_wh(self) -> Tuple[float, float]:
+        # Outlines are write-once, so the layout size is computed on first use only.
+        if self._bbox_wh is None:
+            self._bbox_wh = panel_bbox(self.outline)
+        return self._bbox_wh
 
-@dataclass
+@dataclass(slots=True)
 class WarningMsg:
     severity: str  # error|warn|info
     code: str
     message: str
     fix: str
 
-def arrange_panels(panels: List[Panel], gap: float = 12.0, max_row_width: float = 340.0):
-    placed = []
-    x = y = 0.0
-    row_h = 0.0
+    def to_dict(self) -> dict:
+        return {"severity": self.severity, "code": self.code, "message": self.message, "fix": self.fix}
+
+@functools.lru_cache(maxsize=64)
+def _shelf_layout(sizes: Tuple[Tuple[float, float], ...], gap: float, max_row_width: float):
+    """First-fit decreasing height (FFDH) shelf packing.
+
+    Parts are taken tallest first; each goes on the first shelf with enough
+    remaining width, else a new shelf is opened below. Returns per-part (x, y)
+    positions in the original order plus the canvas size.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: -sizes[i][1])
+    shelves: List[List[float]] = []  # [y, height, next_x]
+    pos: List[Tuple[float, float]] = [(0.0, 0.0)] * len(sizes)
     total_w = total_h = 0.0
-    for p in panels:
-        bw, bh = panel_bbox(p.outline)
-        if placed and (x + bw > max_row_width):
-            x = 0.0
-            y += row_h + gap
-            row_h = 0.0
-        placed.append((p, x, y))
-        x += bw + gap
-        row_h = max(row_h, bh)
-        total_w = max(total_w, x)
-        total_h = max(total_h, y + row_h)
-    return placed, total_w + gap, total_h + gap
+    for i in order:
+        bw, bh = sizes[i]
+        for shelf in shelves:
+            if shelf[2] + bw <= max_row_width:
+                break
+        else:
+            y = (shelves[-1][0] + shelves[-1][1] + gap) if shelves else 0.0
+            shelf = [y, bh, 0.0]
+            shelves.append(shelf)
+        pos[i] = (shelf[2], shelf[0])
+        shelf[2] += bw + gap
+        total_w = max(total_w, shelf[2])
+        total_h = max(total_h, shelf[0] + shelf[1])
+    return tuple(pos), total_w + gap, total_h + gap
+
+def arrange_panels(panels: Iterable[Panel], gap: float = 12.0, max_row_width: float = 340.0):
+    # Shelf packing needs every size up front, so a lazily built panel stream is drained once here.
+    if not isinstance(panels, (list, tuple)):
+        panels = list(panels)
+    pos, W, H = _shelf_layout(tuple(p.bbox_wh for p in panels), gap, max_row_width)
+    placed = [(p, x, y) for p, (x, y) in zip(panels, pos)]
+    return placed, W, H
 
 def svg_header(W: float, H: float) -> str:
     return f"""<?xml version="1.0" encoding="UTF-8"?>
@@ -162,42 +303,68 @@ def svg_header(W: float, H: float) -> str:
 def svg_footer() -> str:
     return "</svg>\n"
 
-def make_svg(
-    panels: List[Panel],
+def write_svg(
+    f,
+    panels: Iterable[Panel],
     meta: dict,
     *,
     max_row_width: float = 340.0,
     gap: float = 12.0,
     stroke_mm: float = 0.2,
     include_labels: bool = True,
-) -> str:
+) -> None:
+    """Stream an SVG document for panels into a text file-like object."""
     placed, W, H = arrange_panels(panels, gap=gap, max_row_width=max_row_width)
-    meta_comment = "\n".join(textwrap.wrap(json.dumps(meta, ensure_ascii=False), width=120))
-    out = [svg_header(W, H)]
-    out.append(f"  <!-- meta: {meta_comment} -->\n")
-    out.append(f'  <g id="CUT" fill="none" stroke="red" stroke-width="{fmt(float(stroke_mm))}">\n')
+    # Single-line compact JSON; "--" is not allowed inside XML comments.
+    meta_comment = json.dumps(meta, ensure_ascii=False, separators=(",", ":")).replace("--", "-\\u002d")
+    w = f.write
+    w(svg_header(W, H))
+    w(f"  <!-- meta: {meta_comment} -->\n")
+    w(f'  <g id="CUT" fill="none" stroke="red" stroke-width="{fmt(float(stroke_mm))}">\n')
     for p, x, y in placed:
-        out.append(f'    <g id="{p.name}" transform="translate({fmt(x)},{fmt(y)})">\n')
-        out.append(f'      <path d="{polyline_to_path(p.outline, close=True)}"/>\n')
+        w(f'    <g id="{p.name}" transform="translate({fmt(x)},{fmt(y)})">\n')
+        # Outline and cutouts share one element as subpaths; evenodd keeps cutouts as holes.
+        w('      <path d="')
+        write_polyline(w, p.outline, close=True)
         for cd in p.cutouts:
-            out.append(f'      <path d="{cd}"/>\n')
-        out.append("    </g>\n")
-    out.append("  </g>\n")
+            w(" ")
+            w(cd)
+        w('" fill-rule="evenodd"/>\n')
+        w("    </g>\n")
+    w("  </g>\n")
     if include_labels:
-        out.append('  <g id="ENGRAVE" fill="black" font-family="Arial" font-size="4">\n')
+        w('  <g id="ENGRAVE" fill="black" font-family="Arial" font-size="4">\n')
         for p, x, y in placed:
             if p.labels:
-                out.append(f'    <g transform="translate({fmt(x)},{fmt(y)})">\n')
+                w(f'    <g transform="translate({fmt(x)},{fmt(y)})">\n')
                 for txt, (tx, ty) in p.labels:
-                    out.append(f'      <text x="{fmt(tx)}" y="{fmt(ty)}">{txt}</text>\n')
-                out.append("    </g>\n")
-        out.append("  </g>\n")
-    out.append(svg_footer())
-    return "".join(out)
+                    w(f'      <text x="{fmt(tx)}" y="{fmt(ty)}">{txt}</text>\n')
+                w("    </g>\n")
+        w("  </g>\n")
+    w(svg_footer())
 
+def make_svg(
+    panels: Iterable[Panel],
+    meta: dict,
+    *,
+    max_row_width: float = 340.0,
+    gap: float = 12.0,
+    stroke_mm: float = 0.2,
+    include_labels: bool = True,
+) -> str:
+    """Render panels to an SVG document string (see `write_svg` for streaming output)."""
+    buf = io.StringIO()
+    write_svg(buf, panels, meta, max_row_width=max_row_width, gap=gap,
+              stroke_mm=stroke_mm, include_labels=include_labels)
+    return buf.getvalue()
 
 def _warn_dicts(warns: List[WarningMsg]) -> List[dict]:
-    return [w.__dict__.copy() for w in (warns or [])]
+    return [w.to_dict() for w in (warns or [])]
+
+
+def _cast(caster, v):
+    # The Pyodide JSON bridge already delivers floats/ints/bools; only convert when needed.
+    return v if type(v) is caster else caster(v)
 
 
 def generate_svg(template_id: str, params: dict) -> dict:
@@ -213,72 +380,31 @@ def generate_svg(template_id: str, params: dict) -> dict:
     if not tid:
         raise ValueError("template_id is required")
 
-    thickness = float(params.get("thickness", 3.0))
-    kerf = float(params.get("kerf", 0.2))
-    fit_clearance = float(params.get("fit_clearance", 0.15))
+    thickness = _cast(float, params.get("thickness", 3.0))
+    kerf = _cast(float, params.get("kerf", 0.2))
+    fit_clearance = _cast(float, params.get("fit_clearance", 0.15))
     finger_w = params.get("finger_w", None)
-    finger_w = None if finger_w is None else float(finger_w)
+    finger_w = None if finger_w is None else _cast(float, finger_w)
 
     # Layout options (UI uses sheet width/padding-like fields).
-    max_row_width = float(params.get("max_row_width", 340.0))
-    gap = float(params.get("gap", 12.0))
+    max_row_width = _cast(float, params.get("max_row_width", 340.0))
+    gap = _cast(float, params.get("gap", 12.0))
 
-    stroke_mm = float(params.get("stroke_mm", 0.2))
+    stroke_mm = _cast(float, params.get("stroke_mm", 0.2))
     include_labels = bool(params.get("labels", True))
 
-    common = dict(thickness=thickness, kerf=kerf, fit_clearance=fit_clearance, finger_w=finger_w)
+    spec = _PARAM_SCHEMAS.get(tid)
+    if spec is None:
+        raise ValueError(f"Unknown template_id: {tid}")
+    builder, schema = spec
+    kwargs = {k: _cast(cast, params.get(k, default)) for k, cast, default in schema}
+    kwargs.update(thickness=thickness, kerf=kerf, fit_clearance=fit_clearance, finger_w=finger_w)
 
-    if tid == "tray_open_front":
-        panels, warns, meta = build_tray_open_front(
-            inner_w=float(params.get("inner_w", 135.0)),
-            inner_d=float(params.get("inner_d", 90.0)),
-            inner_h=float(params.get("inner_h", 80.0)),
-            front_h=float(params.get("front_h", 30.0)),
-            scoop=bool(params.get("scoop", True)),
-            scoop_r=float(params.get("scoop_r", 22.0)),
-            scoop_depth=float(params.get("scoop_depth", 16.0)),
-            **common,
-        )
-    elif tid == "divider_rack":
-        panels, warns, meta = build_divider_rack(
-            inner_w=float(params.get("inner_w", 135.0)),
-            inner_d=float(params.get("inner_d", 90.0)),
-            inner_h=float(params.get("inner_h", 80.0)),
-            divider_count=int(params.get("divider_count", 3)),
-            **common,
-        )
-    elif tid == "window_front":
-        panels, warns, meta = build_window_front(
-            inner_w=float(params.get("inner_w", 135.0)),
-            inner_d=float(params.get("inner_d", 90.0)),
-            inner_h=float(params.get("inner_h", 80.0)),
-            window_margin=float(params.get("window_margin", 12.0)),
-            **common,
-        )
-    elif tid == "card_shoe":
-        panels, warns, meta = build_card_shoe_front_draw(
-            card_w=float(params.get("card_w", 63.0)),
-            card_h=float(params.get("card_h", 88.0)),
-            card_t=float(params.get("card_t", 0.35)),
-            capacity=int(params.get("capacity", 60)),
-            ramp_angle_deg=float(params.get("ramp_angle_deg", 12.0)),
-            **common,
-        )
-    elif tid == "rotary_wheel":
-        # Legacy ID: previously pointed at a simplified prototype that is not mechanically valid.
-        # Keep backward-compat for old links by generating the real mechanism, but block export.
-        panels, warns, meta = build_candy_machine_rotary_layered(
-            max_piece=float(params.get("max_piece", 18.0)),
-            irregular=bool(params.get("irregular", False)),
-            hopper_h=float(params.get("hopper_h", 120.0)),
-            depth_layers_total=int(params.get("depth_layers_total", 8)),
-            wheel_layers=int(params.get("wheel_layers", 3)),
-            screw_d=float(params.get("screw_d", 3.2)),
-            screw_margin=float(params.get("screw_margin", 6.0)),
-            axle_d=float(params.get("axle_d", 3.2)),
-            add_feet=bool(params.get("add_feet", False)),
-            **common,
-        )
+    key = tuple(sorted(kwargs.items()))
+    _panels, warns, meta = _build_cached(builder, key)
+    svg = _render_cached(builder, key, max_row_width, gap, stroke_mm, include_labels)
+
+    if tid == "rotary_wheel":
         warns = [
             WarningMsg(
                 "error",
@@ -287,23 +413,27 @@ def generate_svg(template_id: str, params: dict) -> dict:
                 "Switch template_id to 'candy_machine_rotary_layered' (Student Mode does this automatically).",
             )
         ] + (warns or [])
-    elif tid == "candy_machine_rotary_layered":
-        panels, warns, meta = build_candy_machine_rotary_layered(
-            max_piece=float(params.get("max_piece", 18.0)),
-            irregular=bool(params.get("irregular", False)),
-            hopper_h=float(params.get("hopper_h", 120.0)),
-            depth_layers_total=int(params.get("depth_layers_total", 8)),
-            wheel_layers=int(params.get("wheel_layers", 3)),
-            screw_d=float(params.get("screw_d", 3.0)),
-            screw_margin=float(params.get("screw_margin", 10.0)),
-            axle_d=float(params.get("axle_d", 6.0)),
-            add_feet=bool(params.get("add_feet", False)),
-            **common,
-        )
-    else:
-        raise ValueError(f"Unknown template_id: {tid}")
 
-    svg = make_svg(
+    return {
+        "svg": svg,
+        "warnings": _warn_dicts(warns),
+        "meta": copy.deepcopy(meta),
+        "bundle_files": {},
+    }
+
+
+# UI sliders re-submit identical parameter sets, so generate_svg() memoizes on the
+# (builder, sorted kwargs) tuple. Cached panels/meta are shared: treat them as read-only.
+@functools.lru_cache(maxsize=32)
+def _build_cached(builder, key: Tuple[Tuple[str, object], ...]):
+    return builder(**dict(key))
+
+
+@functools.lru_cache(maxsize=32)
+def _render_cached(builder, key: Tuple[Tuple[str, object], ...], max_row_width: float, gap: float,
+                   stroke_mm: float, include_labels: bool) -> str:
+    panels, _warns, meta = _build_cached(builder, key)
+    return make_svg(
         panels,
         meta,
         max_row_width=max_row_width,
@@ -312,15 +442,9 @@ def generate_svg(template_id: str, params: dict) -> dict:
         include_labels=include_labels,
     )
 
-    return {
-        "svg": svg,
-        "warnings": _warn_dicts(warns),
-        "meta": meta,
-        "bundle_files": {},
-    }
-
 def mk_panel_rect(name: str, w: float, h: float, *, t: float, finger_w: float,
-                  joints: Dict[str, bool], phases: Dict[str, int], cutouts=None, labels=None) -> Panel:
+                  joints: Tuple[bool, bool, bool, bool], phases: Tuple[int, int, int, int],
+                  cutouts=None, labels=None) -> Panel:
     outline = rect_with_fingers(w, h, t=t, finger_w=finger_w, joints=joints, phases=phases)
     return Panel(name=name, outline=outline, cutouts=cutouts or [], labels=labels or [(name, (w*0.35, h*0.55))])
 
@@ -344,9 +468,6 @@ def build_tray_open_front(*, inner_w: float, inner_d: float, inner_h: float,
     W_out = inner_w + 2*t
     D_out = inner_d + 2*t
 
-    phases0 = {"top": 0, "right": 0, "bottom": 0, "left": 0}
-    phases1 = {"top": 1, "right": 1, "bottom": 1, "left": 1}
-
     warns: List[WarningMsg] = []
     if front_h >= inner_h:
         warns.append(WarningMsg("warn", "TRAY_FRONT_TOO_TALL",
@@ -357,18 +478,16 @@ def build_tray_open_front(*, inner_w: float, inner_d: float, inner_h: float,
 
     # Bottom (jointed all around)
     panels.append(mk_panel_rect("BOTTOM", W_out, D_out, t=t, finger_w=finger_w,
-                               joints={"top": True, "right": True, "bottom": True, "left": True},
-                               phases=phases0,
+                               joints=_ALL_JOINTED,
+                               phases=_PHASES0,
                                labels=[("BOTTOM", (W_out*0.4, D_out*0.55))]))
 
     # Left/Right walls (depth x height), open top
-    side_j = {"top": False, "right": True, "bottom": True, "left": True}
-    panels.append(mk_panel_rect("LEFT", D_out, inner_h, t=t, finger_w=finger_w, joints=side_j, phases=phases1))
-    panels.append(mk_panel_rect("RIGHT", D_out, inner_h, t=t, finger_w=finger_w, joints=side_j, phases=phases1))
+    panels.append(mk_panel_rect("LEFT", D_out, inner_h, t=t, finger_w=finger_w, joints=_OPEN_TOP, phases=_PHASES1))
+    panels.append(mk_panel_rect("RIGHT", D_out, inner_h, t=t, finger_w=finger_w, joints=_OPEN_TOP, phases=_PHASES1))
 
     # Back wall (width x height)
-    back_j = {"top": False, "right": True, "bottom": True, "left": True}
-    panels.append(mk_panel_rect("BACK", W_out, inner_h, t=t, finger_w=finger_w, joints=back_j, phases=phases0))
+    panels.append(mk_panel_rect("BACK", W_out, inner_h, t=t, finger_w=finger_w, joints=_OPEN_TOP, phases=_PHASES0))
 
     # Front lip (width x front_h) with optional scoop cutout
     cutouts = []
@@ -377,15 +496,15 @@ def build_tray_open_front(*, inner_w: float, inner_d: float, inner_h: float,
         y_top = max(2.0, front_h - scoop_depth)
         cutouts.append(thumb_notch_path(W_out, y_top=y_top, radius=min(scoop_r, W_out*0.25), depth=min(scoop_depth, front_h-2.0)))
     panels.append(mk_panel_rect("FRONT_LIP", W_out, front_h, t=t, finger_w=finger_w,
-                               joints={"top": False, "right": True, "bottom": True, "left": True},
-                               phases=phases0, cutouts=cutouts,
+                               joints=_OPEN_TOP,
+                               phases=_PHASES0, cutouts=cutouts,
                                labels=[("FRONT_LIP", (W_out*0.32, front_h*0.65))]))
 
     meta = {
         "template": "TRAY_OPEN_FRONT_v0.7_proto",
         "inputs": {"inner_w": inner_w, "inner_d": inner_d, "inner_h": inner_h, "front_h": front_h},
         "fabrication": {"thickness": thickness, "kerf": kerf, "fit_clearance": fit_clearance},
-        "warnings": [w.__dict__ for w in warns],
+        "warnings": _warn_dicts(warns),
     }
     return panels, warns, meta
 
@@ -403,17 +522,14 @@ def build_divider_rack(*, inner_w: float, inner_d: float, inner_h: float,
     W_out = inner_w + 2*t
     D_out = inner_d + 2*t
 
-    phases0 = {"top": 0, "right": 0, "bottom": 0, "left": 0}
-    phases1 = {"top": 1, "right": 1, "bottom": 1, "left": 1}
-
     warns: List[WarningMsg] = []
     if divider_count < 2:
         warns.append(WarningMsg("error", "DIV_TOO_FEW", "divider_count must be >= 2.", "Increase divider_count."))
 
     # Bottom with slots
     bottom = rect_with_fingers(W_out, D_out, t=t, finger_w=finger_w,
-                               joints={"top": True, "right": True, "bottom": True, "left": True},
-                               phases=phases0)
+                               joints=_ALL_JOINTED,
+                               phases=_PHASES0)
     bottom_cutouts = []
 
     # Slots positioned evenly across width, inside clearance from edges
@@ -426,22 +542,18 @@ def build_divider_rack(*, inner_w: float, inner_d: float, inner_h: float,
     else:
         # slots located at interior x positions: margin + k*gap
         gap = usable / divider_count
-        for i in range(1, divider_count):
-            x = t + margin + i*gap - slot_w/2
-            y = t + 6.0
-            h = inner_d - 12.0
-            bottom_cutouts.append(rect_path(x, y, slot_w, h))
+        y = t + 6.0
+        h = inner_d - 12.0
+        bottom_cutouts = [rect_path(t + margin + i*gap - slot_w/2, y, slot_w, h) for i in range(1, divider_count)]
 
     panels: List[Panel] = []
     panels.append(Panel("BOTTOM", bottom, bottom_cutouts, [("BOTTOM", (W_out*0.4, D_out*0.55))]))
 
     # Walls like open-front tray but full front
-    side_j = {"top": False, "right": True, "bottom": True, "left": True}
-    back_j = {"top": False, "right": True, "bottom": True, "left": True}
-    panels.append(mk_panel_rect("LEFT", D_out, inner_h, t=t, finger_w=finger_w, joints=side_j, phases=phases1))
-    panels.append(mk_panel_rect("RIGHT", D_out, inner_h, t=t, finger_w=finger_w, joints=side_j, phases=phases1))
-    panels.append(mk_panel_rect("BACK", W_out, inner_h, t=t, finger_w=finger_w, joints=back_j, phases=phases0))
-    panels.append(mk_panel_rect("FRONT", W_out, inner_h*0.6, t=t, finger_w=finger_w, joints=back_j, phases=phases0,
+    panels.append(mk_panel_rect("LEFT", D_out, inner_h, t=t, finger_w=finger_w, joints=_OPEN_TOP, phases=_PHASES1))
+    panels.append(mk_panel_rect("RIGHT", D_out, inner_h, t=t, finger_w=finger_w, joints=_OPEN_TOP, phases=_PHASES1))
+    panels.append(mk_panel_rect("BACK", W_out, inner_h, t=t, finger_w=finger_w, joints=_OPEN_TOP, phases=_PHASES0))
+    panels.append(mk_panel_rect("FRONT", W_out, inner_h*0.6, t=t, finger_w=finger_w, joints=_OPEN_TOP, phases=_PHASES0,
                                labels=[("FRONT (LOW)", (W_out*0.28, inner_h*0.35))]))
 
     # Divider panels with bottom tabs that fit the slots (glue optional)
@@ -476,20 +588,23 @@ def build_divider_rack(*, inner_w: float, inner_d: float, inner_h: float,
         ]
         return out
 
+    div_outline = divider_outline()
+    dividers_added = False
     for i in range(divider_count-1):
-        panels.append(Panel(f"DIVIDER_{i+1}", divider_outline(), [], [(f"DIVIDER_{i+1}", (div_w*0.2, div_h*0.6))]))
+        panels.append(Panel(f"DIVIDER_{i+1}", div_outline, [], [(f"DIVIDER_{i+1}", (div_w*0.2, div_h*0.6))]))
+        dividers_added = True
 
     # Required features: slots + dividers
     if not bottom_cutouts:
         warns.append(WarningMsg("error", "DIV_NO_SLOTS", "Bottom divider slots missing.", "Ensure bottom slots are generated."))
-    if not any(p.name.startswith("DIVIDER_") for p in panels):
+    if not dividers_added:
         warns.append(WarningMsg("error", "DIV_NO_DIVIDERS", "Divider parts missing.", "Generate divider parts."))
 
     meta = {
         "template": "DIVIDER_RACK_v0.7_proto",
         "inputs": {"inner_w": inner_w, "inner_d": inner_d, "inner_h": inner_h, "divider_count": divider_count},
         "fabrication": {"thickness": thickness, "kerf": kerf, "fit_clearance": fit_clearance, "drawn_slot_w": slot_w},
-        "warnings": [w.__dict__ for w in warns],
+        "warnings": _warn_dicts(warns),
     }
     return panels, warns, meta
 
@@ -506,36 +621,32 @@ def build_window_front(*, inner_w: float, inner_d: float, inner_h: float,
     D_out = inner_d + 2*t
     H = inner_h
 
-    phases0 = {"top": 0, "right": 0, "bottom": 0, "left": 0}
-    phases1 = {"top": 1, "right": 1, "bottom": 1, "left": 1}
-
     warns: List[WarningMsg] = []
 
     panels: List[Panel] = []
     panels.append(mk_panel_rect("BOTTOM", W_out, D_out, t=t, finger_w=finger_w,
-                               joints={"top": True, "right": True, "bottom": True, "left": True},
-                               phases=phases0))
-    wall_j = {"top": True, "right": True, "bottom": True, "left": True}
-    panels.append(mk_panel_rect("LEFT", D_out, H, t=t, finger_w=finger_w, joints={"top": True,"right": True,"bottom": True,"left": True}, phases=phases1))
-    panels.append(mk_panel_rect("RIGHT", D_out, H, t=t, finger_w=finger_w, joints={"top": True,"right": True,"bottom": True,"left": True}, phases=phases1))
-    panels.append(mk_panel_rect("BACK", W_out, H, t=t, finger_w=finger_w, joints={"top": True,"right": True,"bottom": True,"left": True}, phases=phases0))
+                               joints=_ALL_JOINTED,
+                               phases=_PHASES0))
+    panels.append(mk_panel_rect("LEFT", D_out, H, t=t, finger_w=finger_w, joints=_ALL_JOINTED, phases=_PHASES1))
+    panels.append(mk_panel_rect("RIGHT", D_out, H, t=t, finger_w=finger_w, joints=_ALL_JOINTED, phases=_PHASES1))
+    panels.append(mk_panel_rect("BACK", W_out, H, t=t, finger_w=finger_w, joints=_ALL_JOINTED, phases=_PHASES0))
     # FRONT with window cutout
     win_w = max(10.0, W_out - 2*window_margin)
     win_h = max(10.0, H - 2*window_margin)
     cutouts = [rounded_rect_path(window_margin, window_margin, win_w, win_h, r=8.0)]
-    panels.append(mk_panel_rect("FRONT", W_out, H, t=t, finger_w=finger_w, joints={"top": True,"right": True,"bottom": True,"left": True}, phases=phases0,
+    panels.append(mk_panel_rect("FRONT", W_out, H, t=t, finger_w=finger_w, joints=_ALL_JOINTED, phases=_PHASES0,
                                cutouts=cutouts,
                                labels=[("FRONT (WINDOW)", (W_out*0.22, H*0.55))]))
     # TOP
     panels.append(mk_panel_rect("TOP", W_out, D_out, t=t, finger_w=finger_w,
-                               joints={"top": True, "right": True, "bottom": True, "left": True},
-                               phases=phases1,
+                               joints=_ALL_JOINTED,
+                               phases=_PHASES1,
                                labels=[("TOP", (W_out*0.45, D_out*0.55))]))
     meta = {
         "template": "WINDOW_FRONT_v0.7_proto",
         "inputs": {"inner_w": inner_w, "inner_d": inner_d, "inner_h": inner_h},
         "fabrication": {"thickness": thickness, "kerf": kerf, "fit_clearance": fit_clearance},
-        "warnings": [w.__dict__ for w in warns],
+        "warnings": _warn_dicts(warns),
     }
     return panels, warns, meta
 
@@ -578,22 +689,17 @@ def build_card_shoe_front_draw(*, card_w: float, card_h: float, card_t: float,
                                 f"Box is tall relative to width (H/W≈{H/W_in:.2f}); may tip during pulling.",
                                 "Enable stabilisers or increase base width."))
 
-    phases0 = {"top": 0, "right": 0, "bottom": 0, "left": 0}
-    phases1 = {"top": 1, "right": 1, "bottom": 1, "left": 1}
-
     panels: List[Panel] = []
 
     panels.append(mk_panel_rect("BOTTOM", W_out, D_out, t=t, finger_w=finger_w,
-                               joints={"top": True, "right": True, "bottom": True, "left": True},
-                               phases=phases0,
+                               joints=_ALL_JOINTED,
+                               phases=_PHASES0,
                                labels=[("BOTTOM", (W_out * 0.4, D_out * 0.55))]))
 
-    side_j = {"top": False, "right": True, "bottom": True, "left": True}
-    panels.append(mk_panel_rect("LEFT", D_out, H, t=t, finger_w=finger_w, joints=side_j, phases=phases1))
-    panels.append(mk_panel_rect("RIGHT", D_out, H, t=t, finger_w=finger_w, joints=side_j, phases=phases1))
+    panels.append(mk_panel_rect("LEFT", D_out, H, t=t, finger_w=finger_w, joints=_OPEN_TOP, phases=_PHASES1))
+    panels.append(mk_panel_rect("RIGHT", D_out, H, t=t, finger_w=finger_w, joints=_OPEN_TOP, phases=_PHASES1))
 
-    back_j = {"top": False, "right": True, "bottom": True, "left": True}
-    panels.append(mk_panel_rect("BACK", W_out, H, t=t, finger_w=finger_w, joints=back_j, phases=phases0))
+    panels.append(mk_panel_rect("BACK", W_out, H, t=t, finger_w=finger_w, joints=_OPEN_TOP, phases=_PHASES0))
 
     cutouts = []
     win_margin_x = max(8.0, (W_out - slot_w) / 2 - 4.0)
@@ -610,9 +716,10 @@ def build_card_shoe_front_draw(*, card_w: float, card_h: float, card_t: float,
     notch_r = min(10.0, slot_w * 0.18)
     cutouts.append(thumb_notch_path(W_out, y_top=lip_h + 1.0, radius=notch_r, depth=min(10.0, notch_r)))
 
-    panels.append(mk_panel_rect("FRONT", W_out, H, t=t, finger_w=finger_w, joints=back_j, phases=phases0,
+    panels.append(mk_panel_rect("FRONT", W_out, H, t=t, finger_w=finger_w, joints=_OPEN_TOP, phases=_PHASES0,
                                cutouts=cutouts,
                                labels=[("FRONT (DRAW)", (W_out * 0.32, H * 0.55))]))
+    front_features_ok = len(cutouts) >= 2
 
     ramp_w = W_in
     ramp_d = D_in
@@ -621,8 +728,8 @@ def build_card_shoe_front_draw(*, card_w: float, card_h: float, card_t: float,
 
     rise = max(8.0, min(H * 0.6, D_in * math.tan(math.radians(ramp_angle_deg))))
     block_d = 25.0
+    outline = [(0, 0), (block_d, 0), (block_d, rise), (0, rise)]
     for i in range(2):
-        outline = [(0, 0), (block_d, 0), (block_d, rise), (0, rise)]
         panels.append(Panel(f"RAMP_BLOCK_{i+1}", outline, [], [(f"RAMP_BLOCK_{i+1}", (2.0, rise * 0.55))]))
     bar_w = ramp_w
     bar_h = min(12.0, rise)
@@ -636,9 +743,8 @@ def build_card_shoe_front_draw(*, card_w: float, card_h: float, card_t: float,
         panels.append(Panel("STABILISER_1", outline, [], [("STABILISER_1", (stab_w * 0.25, stab_d * 0.7))]))
         panels.append(Panel("STABILISER_2", outline, [], [("STABILISER_2", (stab_w * 0.25, stab_d * 0.7))]))
 
-    if not any(p.name == "RAMP_PLATE" for p in panels):
-        warns.append(WarningMsg("error", "CS_NO_RAMP", "Internal support (ramp) is missing.", "Add ramp parts."))
-    if not any(p.name == "FRONT" and len(p.cutouts) >= 2 for p in panels):
+    # The ramp parts are always appended; only the front features can go missing.
+    if not front_features_ok:
         warns.append(WarningMsg("error", "CS_NO_FRONT_FEATURES", "Front draw cutouts are missing.", "Ensure draw slot + window exist."))
 
     meta = {
@@ -646,7 +752,7 @@ def build_card_shoe_front_draw(*, card_w: float, card_h: float, card_t: float,
         "inputs": {"card_w": card_w, "card_h": card_h, "card_t": card_t, "capacity": capacity},
         "fabrication": {"thickness": thickness, "kerf": kerf, "fit_clearance": fit_clearance},
         "derived": {"W_in": W_in, "D_in": D_in, "H_in": H_in, "slot_h": slot_h, "slot_w": slot_w, "lip_h": lip_h, "ramp_rise": rise},
-        "warnings": [w.__dict__ for w in warns],
+        "warnings": _warn_dicts(warns),
     }
     return panels, warns, meta
 
@@ -660,11 +766,11 @@ def build_rotary_wheel_candy(*, max_piece: float, irregular: bool,
     pocket_d = p + (2.0 if irregular else 1.0)
     pocket_r = pocket_d / 2
 
-    pocket_count = max(6, int(round(2 * math.pi * (pocket_d * 1.5) / max(6.0, pocket_d))))
+    pocket_count = max(6, int(round(math.tau * (pocket_d * 1.5) / max(6.0, pocket_d))))
     if pocket_count % 2 == 1:
         pocket_count += 1
 
-    wheel_r = max(30.0, (pocket_count * pocket_d / (2 * math.pi)) * 1.35)
+    wheel_r = max(30.0, (pocket_count * pocket_d / math.tau) * 1.35)
     wheel_d = 2 * wheel_r
 
     chute_w = pocket_d + 2.0
@@ -676,7 +782,7 @@ def build_rotary_wheel_candy(*, max_piece: float, irregular: bool,
                                 f"Chute width {chute_w:.2f}mm is <= max piece {p:.2f}mm (bridging).",
                                 "Increase chute width or reduce max_piece input."))
 
-    wall_between = (2 * math.pi * wheel_r / pocket_count) - pocket_d
+    wall_between = (math.tau * wheel_r / pocket_count) - pocket_d
     if wall_between < 2.0:
         warns.append(WarningMsg("error", "RW_POCKET_WALL_TOO_THIN",
                                 f"Wall between pockets ≈{wall_between:.2f}mm (<2.0mm).",
@@ -692,74 +798,88 @@ def build_rotary_wheel_candy(*, max_piece: float, irregular: bool,
 
     panels: List[Panel] = []
 
-    base_outline = [(0, 0), (plate_w, 0), (plate_w, plate_h), (0, plate_h)]
+    base_outline = ((0, 0), (plate_w, 0), (plate_w, plate_h), (0, plate_h))
+    # Formatted once; the same immutable path string is reused by BASE_PLATE and TOP_PLATE.
+    plate_axle_hole = circle_path(cx, cy, axle_d / 2)
     base_cutouts = [
-        circle_path(cx, cy, axle_d / 2),
+        plate_axle_hole,
         rounded_rect_path(cx - chute_w/2, plate_h - chute_h - 6.0, chute_w, chute_h, r=2.0),
     ]
     panels.append(Panel("BASE_PLATE", base_outline, base_cutouts, [("BASE_PLATE", (plate_w * 0.33, plate_h * 0.55))]))
 
     segs = 96
-    wheel_outline = []
-    for i in range(segs):
-        ang = 2 * math.pi * i / segs
-        wheel_outline.append((wheel_r * math.cos(ang) + wheel_r, wheel_r * math.sin(ang) + wheel_r))
+    wheel_outline = _circle_outline(wheel_r, segs=segs)
     wheel_cutouts = [circle_path(wheel_r, wheel_r, axle_d/2)]
     pocket_ring_r = wheel_r - pocket_d * 0.85
-    for i in range(pocket_count):
-        ang = 2 * math.pi * i / pocket_count
-        px = wheel_r + pocket_ring_r * math.cos(ang)
-        py = wheel_r + pocket_ring_r * math.sin(ang)
-        wheel_cutouts.append(circle_path(px, py, pocket_r))
+    wheel_cutouts += circle_ring_paths(wheel_r, wheel_r, pocket_ring_r, pocket_r, pocket_count)
     panels.append(Panel("WHEEL", wheel_outline, wheel_cutouts, [("WHEEL", (wheel_r * 0.6, wheel_r * 1.05))]))
 
-    def donut(name: str) -> Panel:
-        outline = []
-        for i in range(segs):
-            ang = 2 * math.pi * i / segs
-            outline.append((ring_outer_r * math.cos(ang) + ring_outer_r, ring_outer_r * math.sin(ang) + ring_outer_r))
-        cutouts = [
-            circle_path(ring_outer_r, ring_outer_r, ring_inner_r),
-            circle_path(ring_outer_r, ring_outer_r, axle_d/2),
-        ]
-        return Panel(name, outline, cutouts, [(name, (ring_outer_r * 0.55, ring_outer_r * 1.05))])
+    ring_outline = _circle_outline(ring_outer_r, segs=segs)
+    ring_cutouts = (
+        circle_path(ring_outer_r, ring_outer_r, ring_inner_r),
+        circle_path(ring_outer_r, ring_outer_r, axle_d/2),
+    )
 
-    panels.append(donut("SPACER_RING_1"))
-    panels.append(donut("SPACER_RING_2"))
+    # Both spacer rings are the same part; they share one outline and cutout tuple.
+    ring_label_at = (ring_outer_r * 0.55, ring_outer_r * 1.05)
+    panels.append(Panel("SPACER_RING_1", ring_outline, ring_cutouts, [("SPACER_RING_1", ring_label_at)]))
+    panels.append(Panel("SPACER_RING_2", ring_outline, ring_cutouts, [("SPACER_RING_2", ring_label_at)]))
 
     top_cutouts = [
         circle_path(cx, cy, ring_inner_r),
-        circle_path(cx, cy, axle_d/2),
+        plate_axle_hole,
     ]
     panels.append(Panel("TOP_PLATE", base_outline, top_cutouts, [("TOP_PLATE", (plate_w * 0.36, plate_h * 0.55))]))
 
-    knob_r = max(12.0, axle_d * 2.5)
-    knob_outline = []
-    for i in range(segs):
-        ang = 2 * math.pi * i / segs
-        knob_outline.append((knob_r * math.cos(ang) + knob_r, knob_r * math.sin(ang) + knob_r))
-    panels.append(Panel("KNOB", knob_outline, [circle_path(knob_r, knob_r, axle_d/2)], [("KNOB", (knob_r * 0.5, knob_r * 1.05))]))
-
-    if not any(p.name == "WHEEL" for p in panels):
-        warns.append(WarningMsg("error", "RW_NO_WHEEL", "Wheel part missing.", "Generate wheel part."))
+    panels.append(_build_knob_panel(axle_d, min_r=12.0, scale=2.5, label_x=0.5))
 
     meta = {
         "template": "ROTARY_WHEEL_CANDY_v0.7_proto",
         "inputs": {"max_piece": max_piece, "irregular": irregular},
         "fabrication": {"thickness": thickness, "kerf": kerf, "fit_clearance": fit_clearance, "finger_w": finger_w, "axle_d": axle_d},
         "derived": {"pocket_d": pocket_d, "pocket_count": pocket_count, "wheel_d": wheel_d, "chute_w": chute_w, "plate_w": plate_w},
-        "warnings": [w.__dict__ for w in warns],
+        "warnings": _warn_dicts(warns),
     }
     return panels, warns, meta
 
 
-def _circle_outline(r: float, *, segs: int = 96) -> List[Point]:
-    segs = max(12, int(segs))
-    pts: List[Point] = []
-    for i in range(segs):
-        ang = 2 * math.pi * i / segs
-        pts.append((r * math.cos(ang) + r, r * math.sin(ang) + r))
-    return pts
+@functools.lru_cache(maxsize=64)
+def _circle_outline_cached(r: float, segs: int) -> Tuple[float, ...]:
+    # Flat (x0, y0, x1, y1, ...) coordinates, memoized immutably per (r, segs).
+    buf = array("d")
+    append = buf.append
+    for c, s in _unit_circle(segs):
+        append(r * c + r); append(r * s + r)
+    return tuple(buf)
+
+
+def _circle_outline(r: float, *, segs: int = 96) -> array:
+    # Each wheel/knob/ring panel gets its own flat array('d') copy of the cached coordinates.
+    return array("d", _circle_outline_cached(r, max(12, int(segs))))
+
+
+def _build_knob_panel(axle_d: float, *, min_r: float = 14.0, scale: float = 2.2,
+                      label_x: float = 0.55) -> Panel:
+    """Round KNOB part with a centred axle hole, shared by both rotary builders."""
+    knob_r = max(min_r, axle_d * scale)
+    return Panel("KNOB", _circle_outline(knob_r), [circle_path(knob_r, knob_r, axle_d / 2.0)],
+                 [("KNOB", (knob_r * label_x, knob_r * 1.05))])
+
+
+# Input checks for the layered machine, evaluated in order as
+# predicate(max_piece, hopper_h, depth_layers_total, wheel_layers) -> warning fires.
+_CM_INPUT_CHECKS = (
+    (lambda p, hopper_h, total, wheel: p <= 0,
+     "error", "CM_MAX_PIECE_INVALID", "max_piece must be > 0.", "Increase max_piece."),
+    (lambda p, hopper_h, total, wheel: hopper_h < 40.0,
+     "warn", "CM_HOPPER_LOW", "Hopper height is quite small; capacity may be low.", "Increase hopper_h."),
+    (lambda p, hopper_h, total, wheel: total < 2,
+     "error", "CM_LAYERS_TOO_FEW", "depth_layers_total must be >= 2.", "Set depth_layers_total to 8 (typical for 3mm boards)."),
+    (lambda p, hopper_h, total, wheel: wheel < 1,
+     "error", "CM_WHEEL_LAYERS_TOO_FEW", "wheel_layers must be >= 1.", "Set wheel_layers to 3 (typical)."),
+    (lambda p, hopper_h, total, wheel: total >= 2 and wheel >= total,
+     "error", "CM_LAYER_SPLIT_INVALID", "wheel_layers must be less than depth_layers_total.", "Make sure there is at least 1 hopper spacer layer."),
+)
 
 
 def build_candy_machine_rotary_layered(
@@ -797,34 +917,41 @@ def build_candy_machine_rotary_layered(
     screw_margin = float(screw_margin)
     axle_d = float(axle_d)
 
-    warns: List[WarningMsg] = []
-
-    if p <= 0:
-        warns.append(WarningMsg("error", "CM_MAX_PIECE_INVALID", "max_piece must be > 0.", "Increase max_piece."))
-    if hopper_h < 40.0:
-        warns.append(WarningMsg("warn", "CM_HOPPER_LOW", "Hopper height is quite small; capacity may be low.", "Increase hopper_h."))
-
-    if depth_layers_total < 2:
-        warns.append(WarningMsg("error", "CM_LAYERS_TOO_FEW", "depth_layers_total must be >= 2.", "Set depth_layers_total to 8 (typical for 3mm boards)."))
-    if wheel_layers < 1:
-        warns.append(WarningMsg("error", "CM_WHEEL_LAYERS_TOO_FEW", "wheel_layers must be >= 1.", "Set wheel_layers to 3 (typical)."))
-    if depth_layers_total >= 2 and wheel_layers >= depth_layers_total:
-        warns.append(WarningMsg("error", "CM_LAYER_SPLIT_INVALID", "wheel_layers must be less than depth_layers_total.", "Make sure there is at least 1 hopper spacer layer."))
+    warns: List[WarningMsg] = [
+        WarningMsg(severity, code, message, fix)
+        for pred, severity, code, message, fix in _CM_INPUT_CHECKS
+        if pred(p, hopper_h, depth_layers_total, wheel_layers)
+    ]
 
     hopper_layers = max(0, int(depth_layers_total) - int(wheel_layers))
     wheel_layers = int(wheel_layers)
     depth_layers_total = int(depth_layers_total)
 
+    meta = {
+        "template": "CANDY_MACHINE_ROTARY_LAYERED_v0.7_proto",
+        "inputs": {
+            "max_piece": max_piece,
+            "irregular": irregular,
+            "hopper_h": hopper_h,
+            "depth_layers_total": depth_layers_total,
+            "wheel_layers": wheel_layers,
+            "screw_d": screw_d,
+            "screw_margin": screw_margin,
+            "axle_d": axle_d,
+            "add_feet": add_feet,
+        },
+        "fabrication": {"thickness": thickness, "kerf": kerf, "fit_clearance": fit_clearance, "finger_w": finger_w},
+    }
     # Derived pocket + wheel geometry.
     safety = 2.0 if irregular else 1.0
     pocket_d = p + safety
     pocket_r = pocket_d / 2.0
 
-    pocket_count = max(8, int(round(2 * math.pi * (pocket_d * 1.6) / max(10.0, pocket_d))))
+    pocket_count = max(8, int(round(math.tau * (pocket_d * 1.6) / max(10.0, pocket_d))))
     if pocket_count % 2 == 1:
         pocket_count += 1
 
-    wheel_r = max(28.0, (pocket_count * pocket_d / (2 * math.pi)) * 1.25)
+    wheel_r = max(28.0, (pocket_count * pocket_d / math.tau) * 1.25)
     wheel_d = 2 * wheel_r
 
     # Chute/feed windows. Keep intentionally generous.
@@ -845,7 +972,7 @@ def build_candy_machine_rotary_layered(
             )
         )
 
-    wall_between = (2 * math.pi * wheel_r / pocket_count) - pocket_d
+    wall_between = (math.tau * wheel_r / pocket_count) - pocket_d
     if wall_between < 2.0:
         warns.append(
             WarningMsg(
@@ -912,128 +1039,195 @@ def build_candy_machine_rotary_layered(
     if screw_margin > min(plate_w, plate_h) / 3:
         warns.append(WarningMsg("warn", "CM_SCREW_MARGIN_LARGE", "Screw margin is large; plates may be oversized.", "Reduce screw_margin."))
 
+    # At least one spacer layer must be left over for the hopper.
+    if hopper_layers <= 0:
+        warns.append(WarningMsg("error", "CM_NO_HOPPER_LAYERS", "No hopper spacer layers were generated.", "Increase depth_layers_total or reduce wheel_layers."))
+
+    meta["derived"] = {
+        "pocket_d": pocket_d,
+        "pocket_count": pocket_count,
+        "wheel_d": wheel_d,
+        "chute_w": chute_w,
+        "plate_w": plate_w,
+        "plate_h": plate_h,
+        "hopper_layers": hopper_layers,
+    }
+    # Invalid inputs block export anyway; every check above is scalar, so skip the
+    # panel geometry but still report the full warning set and derived sizes.
+    if any(w.severity == "error" for w in warns):
+        meta["warnings"] = _warn_dicts(warns)
+        return [], warns, meta
+
     panels: List[Panel] = []
 
-    plate_outline = [(0.0, 0.0), (plate_w, 0.0), (plate_w, plate_h), (0.0, plate_h)]
+    plate_outline = ((0.0, 0.0), (plate_w, 0.0), (plate_w, plate_h), (0.0, plate_h))
 
-    def screw_holes() -> List[str]:
-        return [circle_path(x, y, hole_r) for (x, y) in screw_pts]
+    # Every plate layer carries the same screw pattern; format it once. The tuple is
+    # never mutated: each layer splices it into its own cutout list.
+    screw_holes = tuple(circle_path(x, y, hole_r) for (x, y) in screw_pts)
+    axle_hole = circle_path(cx, cy, axle_d / 2.0)
 
     # FRONT acrylic: screw holes + axle + dispense opening.
-    front_cutouts = []
-    front_cutouts += screw_holes()
-    front_cutouts.append(circle_path(cx, cy, axle_d / 2.0))
+    front_cutouts = [*screw_holes, axle_hole]
     front_cutouts.append(rounded_rect_path(opening_x, opening_y, opening_w, opening_h, r=3.0))
     panels.append(Panel("FRONT_ACRYLIC", plate_outline, front_cutouts, [("FRONT_ACRYLIC", (plate_w * 0.22, plate_h * 0.55))]))
 
     # BACK plate: screw holes + axle.
-    back_cutouts = []
-    back_cutouts += screw_holes()
-    back_cutouts.append(circle_path(cx, cy, axle_d / 2.0))
+    back_cutouts = [*screw_holes, axle_hole]
     panels.append(Panel("BACK_PLATE", plate_outline, back_cutouts, [("BACK_PLATE", (plate_w * 0.30, plate_h * 0.55))]))
 
     # Hopper spacer layers: hollow hopper cavity, plus screw + axle clearance.
-    hopper_cutouts = []
-    hopper_cutouts += screw_holes()
+    hopper_cutouts = list(screw_holes)
     hopper_cutouts.append(circle_path(cx, cy, axle_d / 2.0 + 0.6))
     hopper_cutouts.append(rounded_rect_path(hopper_x, hopper_y, hopper_w, hopper_h_cut, r=6.0))
-
-    for i in range(hopper_layers):
-        panels.append(
-            Panel(
-                f"HOPPER_SPACER_{i+1}",
-                plate_outline,
-                hopper_cutouts,
-                [(f"HOPPER_{i+1}", (plate_w * 0.22, plate_h * 0.58))],
-            )
+    # One frozen cutout tuple is shared by every layer; only name/label vary per panel.
+    hopper_cutouts = tuple(hopper_cutouts)
+
+    # Layers are streamed into the list; each is only a name/label shell over shared geometry.
+    panels.extend(
+        Panel(
+            f"HOPPER_SPACER_{i+1}",
+            plate_outline,
+            hopper_cutouts,
+            [(f"HOPPER_{i+1}", (plate_w * 0.22, plate_h * 0.58))],
         )
+        for i in range(hopper_layers)
+    )
 
     # Wheel spacer layers: wheel cavity + feed window + exit window + chute channel.
-    wheel_cutouts = []
-    wheel_cutouts += screw_holes()
+    wheel_cutouts = list(screw_holes)
     wheel_cutouts.append(circle_path(cx, cy, axle_d / 2.0 + 0.8))
     wheel_cutouts.append(circle_path(cx, cy, wheel_cavity_r))
     wheel_cutouts.append(rounded_rect_path(feed_x, feed_y, feed_w, feed_h, r=3.0))
     wheel_cutouts.append(rounded_rect_path(exit_x, exit_y, exit_w, exit_h, r=3.0))
     wheel_cutouts.append(rounded_rect_path(chute_x, chute_y, chute_w, chute_h, r=3.0))
-
-    for i in range(wheel_layers):
-        panels.append(
-            Panel(
-                f"WHEEL_SPACER_{i+1}",
-                plate_outline,
-                wheel_cutouts,
-                [(f"WHEEL_{i+1}", (plate_w * 0.22, plate_h * 0.62))],
-            )
+    wheel_cutouts = tuple(wheel_cutouts)
+
+    panels.extend(
+        Panel(
+            f"WHEEL_SPACER_{i+1}",
+            plate_outline,
+            wheel_cutouts,
+            [(f"WHEEL_{i+1}", (plate_w * 0.22, plate_h * 0.62))],
         )
+        for i in range(wheel_layers)
+    )
 
     # Wheel part (pocket wheel).
     wheel_outline = _circle_outline(wheel_r)
     pocket_ring_r = wheel_r - pocket_d * 0.85
     wheel_cutouts2 = [circle_path(wheel_r, wheel_r, axle_d / 2.0)]
-    for i in range(pocket_count):
-        ang = 2 * math.pi * i / pocket_count
-        px = wheel_r + pocket_ring_r * math.cos(ang)
-        py = wheel_r + pocket_ring_r * math.sin(ang)
-        wheel_cutouts2.append(circle_path(px, py, pocket_r))
+    wheel_cutouts2 += circle_ring_paths(wheel_r, wheel_r, pocket_ring_r, pocket_r, pocket_count)
     panels.append(Panel("WHEEL", wheel_outline, wheel_cutouts2, [("WHEEL", (wheel_r * 0.45, wheel_r * 1.05))]))
 
     # Knob.
-    knob_r = max(14.0, axle_d * 2.2)
-    knob_outline = _circle_outline(knob_r)
-    panels.append(Panel("KNOB", knob_outline, [circle_path(knob_r, knob_r, axle_d / 2.0)], [("KNOB", (knob_r * 0.55, knob_r * 1.05))]))
+    panels.append(_build_knob_panel(axle_d))
 
     # Optional feet.
     if add_feet:
         foot_w = max(30.0, plate_w * 0.28)
         foot_h = 12.0
-        foot_outline = [(0.0, 0.0), (foot_w, 0.0), (foot_w, foot_h), (0.0, foot_h)]
+        foot_outline = ((0.0, 0.0), (foot_w, 0.0), (foot_w, foot_h), (0.0, foot_h))
         panels.append(Panel("FOOT_1", foot_outline, [], [("FOOT_1", (2.0, foot_h * 0.7))]))
         panels.append(Panel("FOOT_2", foot_outline, [], [("FOOT_2", (2.0, foot_h * 0.7))]))
 
-    # Required parts checks.
-    if not any(p.name == "WHEEL" for p in panels):
-        warns.append(WarningMsg("error", "CM_NO_WHEEL", "Wheel part missing.", "Generate wheel part."))
-    if hopper_layers <= 0:
-        warns.append(WarningMsg("error", "CM_NO_HOPPER_LAYERS", "No hopper spacer layers were generated.", "Increase depth_layers_total or reduce wheel_layers."))
-
-    meta = {
-        "template": "CANDY_MACHINE_ROTARY_LAYERED_v0.7_proto",
-        "inputs": {
-            "max_piece": max_piece,
-            "irregular": irregular,
-            "hopper_h": hopper_h,
-            "depth_layers_total": depth_layers_total,
-            "wheel_layers": wheel_layers,
-            "screw_d": screw_d,
-            "screw_margin": screw_margin,
-            "axle_d": axle_d,
-            "add_feet": add_feet,
-        },
-        "fabrication": {"thickness": thickness, "kerf": kerf, "fit_clearance": fit_clearance, "finger_w": finger_w},
-        "derived": {
-            "pocket_d": pocket_d,
-            "pocket_count": pocket_count,
-            "wheel_d": wheel_d,
-            "chute_w": chute_w,
-            "plate_w": plate_w,
-            "plate_h": plate_h,
-            "hopper_layers": hopper_layers,
-        },
-        "warnings": [w.__dict__ for w in warns],
-    }
+    meta["warnings"] = _warn_dicts(warns)
     return panels, warns, meta
 
+# ---------------------- generate_svg parameter schemas ----------------------
+
+# template_id -> (builder, ((param key, caster, default), ...)). Param keys match the
+# builder keyword names; fabrication params (thickness/kerf/fit/finger_w) are shared.
+_CANDY_LAYERED_SCHEMA = (
+    ("max_piece", float, 18.0),
+    ("irregular", bool, False),
+    ("hopper_h", float, 120.0),
+    ("depth_layers_total", int, 8),
+    ("wheel_layers", int, 3),
+    ("screw_d", float, 3.0),
+    ("screw_margin", float, 10.0),
+    ("axle_d", float, 6.0),
+    ("add_feet", bool, False),
+)
+
+_PARAM_SCHEMAS = {
+    "tray_open_front": (build_tray_open_front, (
+        ("inner_w", float, 135.0),
+        ("inner_d", float, 90.0),
+        ("inner_h", float, 80.0),
+        ("front_h", float, 30.0),
+        ("scoop", bool, True),
+        ("scoop_r", float, 22.0),
+        ("scoop_depth", float, 16.0),
+    )),
+    "divider_rack": (build_divider_rack, (
+        ("inner_w", float, 135.0),
+        ("inner_d", float, 90.0),
+        ("inner_h", float, 80.0),
+        ("divider_count", int, 3),
+    )),
+    "window_front": (build_window_front, (
+        ("inner_w", float, 135.0),
+        ("inner_d", float, 90.0),
+        ("inner_h", float, 80.0),
+        ("window_margin", float, 12.0),
+    )),
+    "card_shoe": (build_card_shoe_front_draw, (
+        ("card_w", float, 63.0),
+        ("card_h", float, 88.0),
+        ("card_t", float, 0.35),
+        ("capacity", int, 60),
+        ("ramp_angle_deg", float, 12.0),
+    )),
+    # Legacy ID: previously pointed at a simplified prototype that is not mechanically valid.
+    # Keep backward-compat for old links by generating the real mechanism, but block export.
+    "rotary_wheel": (build_candy_machine_rotary_layered, tuple(
+        (k, cast, {"screw_d": 3.2, "screw_margin": 6.0, "axle_d": 3.2}.get(k, default))
+        for k, cast, default in _CANDY_LAYERED_SCHEMA
+    )),
+    "candy_machine_rotary_layered": (build_candy_machine_rotary_layered, _CANDY_LAYERED_SCHEMA),
+}
+
 # ---------------------- CLI ----------------------
 
+def _sweep_job(cfg: dict) -> Tuple[str, List[dict]]:
+    res = generate_svg(cfg["template"], cfg)
+    with open(cfg["out"], "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write(res["svg"])
+    return cfg["out"], res["warnings"]
+
+
+def run_sweep(path: str, max_workers: Optional[int] = None) -> int:
+    """Build every config in a JSON list in parallel; returns the number of blocked exports.
+
+    Each entry is a generate_svg() params dict plus "template" (template_id) and "out" (SVG path).
+    """
+    # Imported lazily: only the CLI sweep needs worker processes (not available under Pyodide).
+    from concurrent.futures import ProcessPoolExecutor
+
+    with open(path, "r", encoding="utf-8") as f:
+        configs = json.load(f)
+    blocked = 0
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as ex:
+        for out, warns in ex.map(_sweep_job, configs):
+            errs = [w for w in warns if w["severity"] == "error"]
+            if errs:
+                blocked += 1
+                print(f"{out}: EXPORT SHOULD BE BLOCKED ({', '.join(w['code'] for w in errs)})")
+            else:
+                print(f"{out}: OK")
+    return blocked
+
+
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument(
         "--template",
         choices=["tray_open_front", "divider_rack", "window_front", "card_shoe", "candy_machine_rotary_layered"],
-        required=True,
     )
-    ap.add_argument("--out", required=True, help="Output SVG path")
+    ap.add_argument("--out", help="Output SVG path")
+    ap.add_argument("--sweep", help='JSON list of parameter sets, each with "template" and "out"; built in parallel')
+    ap.add_argument("--workers", type=int, default=None, help="Worker processes for --sweep (default: CPU count)")
 
     ap.add_argument("--thickness", type=float, default=3.0)
     ap.add_argument("--kerf", type=float, default=0.2)
@@ -1068,6 +1262,12 @@ def main():
 
     args = ap.parse_args()
 
+    if args.sweep:
+        run_sweep(args.sweep, max_workers=args.workers)
+        return
+    if not args.template or not args.out:
+        ap.error("--template and --out are required unless --sweep is given")
+
     common = dict(thickness=args.thickness, kerf=args.kerf, fit_clearance=args.fit)
 
     if args.template == "tray_open_front":
@@ -1110,9 +1310,9 @@ def main():
     else:
         raise ValueError(f"Unknown template: {args.template}")
 
-    svg = make_svg(panels, meta)
-    with open(args.out, "w", encoding="utf-8") as f:
-        f.write(svg)
+    # Stream straight to disk through a 1 MiB buffer; no whole-document string is built.
+    with open(args.out, "w", encoding="utf-8", buffering=1 << 20) as f:
+        write_svg(f, panels, meta)
 
     errs = [w for w in warns if w.severity == "error"]
     if errs:
@@ -77,3 +77,29 @@ def test_panel_outline_closed_non_empty():
         assert len(panel.outline) >= 4
         area = gen.polygon_area(panel.outline)
         assert not math.isclose(area, 0.0, abs_tol=1e-6)
+
+
+@pytest.mark.parametrize("delta", [0.1, -0.1, 0.075, -2.5])
+@pytest.mark.parametrize("start, reverse", [(0, False), (1, False), (2, True), (3, True)])
+def test_rect_offset_fast_path_matches_clipper(delta, start, reverse):
+    pc = pytest.importorskip("pyclipper")
+    rect = [(3.1, 70.0), (72.9, 70.0), (72.9, 88.0), (3.1, 88.0)]
+    if reverse:
+        rect = rect[::-1]
+    rect = rect[start:] + rect[:start]
+
+    fast = gen._offset_axis_rect(rect, delta)
+    ref = gen._offset_polygon_clipper(pc, rect, delta)
+    assert set(fast) == set(ref)
+    assert math.copysign(1, gen.polygon_area(fast)) == math.copysign(1, gen.polygon_area(ref))
+    # Same start vertex too, so the emitted path text is identical to the clipper path.
+    assert fast[0] == ref[0]
+    assert gen.offset_polygon_pyclipper(rect, delta) == ref
+
+
+def test_rect_offset_fast_path_collapse_returns_none():
+    pc = pytest.importorskip("pyclipper")
+    rect = [(0.0, 0.0), (10.0, 0.0), (10.0, 4.0), (0.0, 4.0)]
+    assert gen._offset_axis_rect(rect, -2.0) is None
+    assert gen._offset_polygon_clipper(pc, rect, -2.0) is None
+    assert gen.offset_polygon_pyclipper(rect, -3.0) is None
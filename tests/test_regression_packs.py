@@ -0,0 +1,46 @@
+import importlib.util
+import json
+import zipfile
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+_spec = importlib.util.spec_from_file_location("regression_v0_7_packs", ROOT / "tools" / "regression_v0_7_packs.py")
+packs = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(packs)
+
+
+def _write_case(params_dir: Path, name: str, template_id: str, params: dict) -> None:
+    (params_dir / name).write_text(json.dumps({"template_id": template_id, "params": params}), encoding="utf-8")
+
+
+def test_packs_written_for_each_case(tmp_path):
+    params_dir = tmp_path / "params"
+    params_dir.mkdir()
+    _write_case(params_dir, "a.json", "card_shoe", {"capacity": 40})
+    _write_case(params_dir, "b.json", "tray_open_front", {})
+    out_dir = tmp_path / "out"
+
+    assert packs.main(["--params-dir", str(params_dir), "--out-dir", str(out_dir), "--date", "20260101"]) == 0
+    for tid in ("card_shoe", "tray_open_front"):
+        with zipfile.ZipFile(out_dir / f"CardBoxGen_{tid}_20260101.zip") as z:
+            assert set(z.namelist()) == packs.EXPECTED_ZIP_FILES
+
+
+def test_cases_sharing_an_output_pack_are_rejected(tmp_path):
+    params_dir = tmp_path / "params"
+    params_dir.mkdir()
+    _write_case(params_dir, "a.json", "card_shoe", {"capacity": 40})
+    _write_case(params_dir, "b.json", "card_shoe", {"capacity": 60})
+    out_dir = tmp_path / "out"
+
+    with pytest.raises(ValueError, match="writes the same pack as"):
+        packs.main(["--params-dir", str(params_dir), "--out-dir", str(out_dir), "--date", "20260101"])
+    assert not out_dir.exists()
+
+
+def test_negative_workers_is_a_usage_error(tmp_path):
+    with pytest.raises(SystemExit) as exc:
+        packs.main(["--params-dir", str(tmp_path), "--workers", "-1"])
+    assert exc.value.code == 2
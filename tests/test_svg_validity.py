@@ -34,3 +34,25 @@ def test_svg_is_valid_xml(tmp_path):
     out = tmp_path / "out.svg"
     out.write_text(svg, encoding="utf-8")
     ET.parse(str(out))
+
+
+def test_svg_precision_is_configurable_and_resettable():
+    import cardboxgen_v0_1 as gen
+
+    assert gen.fmt(12.34567) == "12.346"
+    try:
+        gen.set_svg_precision(1)
+        assert gen.fmt(12.34567) == "12.3"
+        assert gen.fmt(12.04) == "12"
+    finally:
+        gen.set_svg_precision(3)
+    assert gen.fmt(12.34567) == "12.346"
+
+
+def test_compact_path_uses_hv_and_merges_straight_runs():
+    import cardboxgen_v0_1 as gen
+
+    pts = [(0, 0), (0, -3), (10, -3), (10, 0), (10, 2.5), (20, 2.5), (20, 2.5), (25.5, 7)]
+    assert gen.polyline_to_path_compact(pts) == "M 0 0 V -3 H 10 V 2.5 H 20 L 25.5 7 Z"
+    # A reversal on the same axis is a real vertex and must be kept.
+    assert gen.polyline_to_path_compact([(0, 0), (0, 5), (0, 2)], close=False) == "M 0 0 V 5 V 2"
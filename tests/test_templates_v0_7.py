@@ -0,0 +1,105 @@
+import xml.etree.ElementTree as ET
+
+import pytest
+
+import cardboxgen_v0_7_templates as tmpl
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (0.0, "0"),
+        (12.0, "12"),
+        (12.5, "12.5"),
+        (-2.5, "-2.5"),
+        (12.3456, "12.346"),
+        (-0.0004, "0"),
+        (1e-12, "0"),
+    ],
+)
+def test_fmt_trims_trailing_zeros(value, expected):
+    assert tmpl.fmt(value) == expected
+
+
+@pytest.mark.parametrize(
+    "template_id",
+    ["tray_open_front", "divider_rack", "window_front", "card_shoe", "candy_machine_rotary_layered"],
+)
+def test_generate_svg_is_valid_xml(template_id):
+    res = tmpl.generate_svg(template_id, {})
+    ET.fromstring(res["svg"])
+    assert isinstance(res["warnings"], list)
+
+
+def test_generate_svg_memoized_result_is_isolated():
+    first = tmpl.generate_svg("card_shoe", {"capacity": 40})
+    first["meta"]["inputs"]["capacity"] = -1
+    first["warnings"].append({"severity": "error"})
+
+    second = tmpl.generate_svg("card_shoe", {"capacity": 40})
+    assert second["svg"] == first["svg"]
+    assert second["meta"]["inputs"]["capacity"] == 40
+    assert all(w["severity"] != "error" for w in second["warnings"])
+
+
+def test_arrange_panels_no_overlap_and_keeps_order():
+    panels, _warns, _meta = tmpl.build_card_shoe_front_draw(card_w=63.0, card_h=88.0, card_t=0.35, capacity=60)
+    placed, W, H = tmpl.arrange_panels(panels, gap=12.0, max_row_width=340.0)
+
+    assert [p.name for p, _x, _y in placed] == [p.name for p in panels]
+    boxes = []
+    for p, x, y in placed:
+        bw, bh = p.bbox_wh
+        assert x + bw <= W and y + bh <= H
+        boxes.append((x, y, x + bw, y + bh))
+    for i, a in enumerate(boxes):
+        for b in boxes[i + 1:]:
+            assert a[2] <= b[0] or b[2] <= a[0] or a[3] <= b[1] or b[3] <= a[1]
+
+
+def test_layered_machine_invalid_inputs_skip_geometry():
+    panels, warns, meta = tmpl.build_candy_machine_rotary_layered(
+        max_piece=18.0, irregular=False, hopper_h=120.0, depth_layers_total=3, wheel_layers=3,
+        screw_d=3.0, screw_margin=10.0, axle_d=6.0,
+    )
+    assert panels == []
+    assert [w.code for w in warns] == ["CM_LAYER_SPLIT_INVALID", "CM_NO_HOPPER_LAYERS"]
+    assert [w["code"] for w in meta["warnings"]] == ["CM_LAYER_SPLIT_INVALID", "CM_NO_HOPPER_LAYERS"]
+    assert meta["derived"]["hopper_layers"] == 0
+
+
+def test_layered_machine_invalid_inputs_report_every_warning():
+    panels, warns, meta = tmpl.build_candy_machine_rotary_layered(
+        max_piece=0.0, irregular=False, hopper_h=20.0, depth_layers_total=1, wheel_layers=1,
+        screw_d=3.0, screw_margin=4.0, axle_d=6.0,
+    )
+    assert panels == []
+    assert [w.code for w in warns] == [
+        "CM_MAX_PIECE_INVALID",
+        "CM_HOPPER_LOW",
+        "CM_LAYERS_TOO_FEW",
+        "CM_SCREW_MARGIN_SMALL",
+        "CM_NO_HOPPER_LAYERS",
+    ]
+    assert set(meta["derived"]) == {"pocket_d", "pocket_count", "wheel_d", "chute_w", "plate_w", "plate_h", "hopper_layers"}
+
+
+def test_rect_with_fingers_returns_independent_outlines():
+    kw = dict(t=3.0, finger_w=12.0, joints=(True, True, True, True), phases=(0, 0, 0, 0))
+    first = tmpl.rect_with_fingers(80.0, 60.0, **kw)
+    expected = list(first)
+    first.append(999.0)
+    assert list(tmpl.rect_with_fingers(80.0, 60.0, **kw)) == expected
+
+    plain = dict(kw, joints=(False, False, False, False))
+    tmpl.rect_with_fingers(80.0, 60.0, **plain).clear()
+    assert len(tmpl.rect_with_fingers(80.0, 60.0, **plain)) == 4
+
+
+def test_circle_outline_copies_are_independent():
+    first = tmpl._circle_outline(20.0, segs=48)
+    assert len(first) == 96
+    expected = list(first)
+    first[0] = -1.0
+    first.append(5.0)
+    assert list(tmpl._circle_outline(20.0, segs=48)) == expected
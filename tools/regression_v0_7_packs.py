@@ -1,13 +1,16 @@
 #!/usr/bin/env python3
 
 import argparse
+import functools
+import hashlib
 import json
+import os
 import sys
 import zipfile
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
 if str(ROOT_DIR) not in sys.path:
@@ -99,23 +102,100 @@ def _validate_svg(svg: str, *, template_id: str) -> None:
         raise ValueError(f"{template_id}: svg does not look like SVG")
 
 
+def _generator_digest() -> str:
+    # Cache entries are only valid for the exact generator source that produced them.
+    return hashlib.sha256((ROOT_DIR / "cardboxgen_v0_7_templates.py").read_bytes()).hexdigest()
+
+
+def _generate_cached(template_id: str, params: Dict[str, Any], cache_dir: Optional[Path], digest: str) -> Any:
+    """generate_svg(), memoized on disk by (generator source, template_id, params) when cache_dir is set."""
+    if cache_dir is None:
+        return generate_svg(template_id, params)
+
+    key_src = json.dumps([digest, template_id, params], sort_keys=True)
+    entry = cache_dir / (hashlib.sha256(key_src.encode("utf-8")).hexdigest() + ".json")
+    if entry.exists():
+        return json.loads(entry.read_text(encoding="utf-8"))
+
+    res = generate_svg(template_id, params)
+    if isinstance(res, dict):
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        entry.write_text(json.dumps(res), encoding="utf-8")
+    return res
+
+
 def _write_zip(out_path: Path, *, svg: str, template_id: str, params: Dict[str, Any], warnings: List[Dict[str, Any]]) -> None:
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with zipfile.ZipFile(out_path, "w", compression=zipfile.ZIP_DEFLATED) as z:
-        z.writestr("cut.svg", svg)
-        z.writestr("project_summary.md", _build_project_summary_md(template_id, params, warnings))
-        z.writestr("assembly_guide.md", _build_stub_md("Assembly Guide", template_id))
-        z.writestr("bom.md", _build_stub_md("Bill of Materials", template_id))
-        z.writestr("teacher_notes.md", _build_stub_md("Teacher Notes", template_id))
-
-    with zipfile.ZipFile(out_path, "r") as z:
-        names = set(z.namelist())
-        if names != EXPECTED_ZIP_FILES:
-            missing = sorted(EXPECTED_ZIP_FILES - names)
-            extra = sorted(names - EXPECTED_ZIP_FILES)
+    entries = [
+        ("cut.svg", svg),
+        ("project_summary.md", _build_project_summary_md(template_id, params, warnings)),
+        ("assembly_guide.md", _build_stub_md("Assembly Guide", template_id)),
+        ("bom.md", _build_stub_md("Bill of Materials", template_id)),
+        ("teacher_notes.md", _build_stub_md("Teacher Notes", template_id)),
+    ]
+
+    # Only the SVG is worth deflating (fast level); the markdown stubs are a few
+    # hundred bytes, where zlib setup costs more than it saves.
+    written: Set[str] = set()
+    duplicates: List[str] = []
+    with zipfile.ZipFile(out_path, "w") as z:
+        for name, body in entries:
+            if name.endswith(".svg"):
+                z.writestr(name, body, compress_type=zipfile.ZIP_DEFLATED, compresslevel=3)
+            else:
+                z.writestr(name, body, compress_type=zipfile.ZIP_STORED)
+            if name in written:
+                duplicates.append(name)
+            written.add(name)
+
+    # Validated from the names actually written, instead of reopening the archive.
+    if duplicates:
+        raise ValueError(f"{template_id}: duplicate zip entries {sorted(set(duplicates))} ({out_path})")
+    if written != EXPECTED_ZIP_FILES:
+        missing = sorted(EXPECTED_ZIP_FILES - written)
+        extra = sorted(written - EXPECTED_ZIP_FILES)
+        raise ValueError(
+            f"{template_id}: zip contents mismatch. Missing={missing} Extra={extra} ({out_path})"
+        )
+
+
+def _zip_path(out_dir: Path, template_id: str, ymd: str) -> Path:
+    return out_dir / f"CardBoxGen_{template_id}_{ymd}.zip"
+
+
+def _check_unique_outputs(cases: List[Case], out_dir: Path, ymd: str) -> None:
+    # Cases may run concurrently, so two cases must never target the same ZIP.
+    seen: Dict[Path, Path] = {}
+    for c in cases:
+        out_path = _zip_path(out_dir, c.template_id, ymd)
+        if out_path in seen:
             raise ValueError(
-                f"{template_id}: zip contents mismatch. Missing={missing} Extra={extra} ({out_path})"
+                f"{c.source_file}: writes the same pack as {seen[out_path]} ({out_path}); "
+                "use one params file per template_id"
             )
+        seen[out_path] = c.source_file
+
+
+def _run_case(c: Case, *, out_dir: Path, ymd: str, cache_dir: Optional[Path], digest: str) -> Tuple[Path, Optional[str]]:
+    """Generate, validate and zip one case; returns (zip path, error message or None)."""
+    out_path = _zip_path(out_dir, c.template_id, ymd)
+    try:
+        res = _generate_cached(c.template_id, c.params, cache_dir, digest)
+        if not isinstance(res, dict):
+            raise TypeError("generate_svg returned non-dict")
+        svg = res.get("svg")
+        warnings = res.get("warnings") or []
+
+        _validate_svg(svg, template_id=c.template_id)
+
+        errors = _find_error_warnings(warnings)
+        if errors:
+            raise ValueError(f"Blocking errors returned: {errors}")
+
+        _write_zip(out_path, svg=svg, template_id=c.template_id, params=c.params, warnings=warnings)
+    except Exception as e:
+        return out_path, str(e)
+    return out_path, None
 
 
 def main(argv: List[str]) -> int:
@@ -135,7 +215,20 @@ def main(argv: List[str]) -> int:
         default=None,
         help="Override date (YYYYMMDD) for deterministic filenames; default is today.",
     )
+    ap.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Reuse generate_svg results stored here for unchanged generator source + params (default: off)",
+    )
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for case generation; 0 uses the CPU count (default: %(default)s, in-process)",
+    )
     args = ap.parse_args(argv)
+    if args.workers < 0:
+        ap.error("--workers must be >= 0")
 
     params_dir = Path(args.params_dir)
     out_dir = Path(args.out_dir)
@@ -148,30 +241,33 @@ def main(argv: List[str]) -> int:
         ymd = date.today().strftime("%Y%m%d")
 
     cases = _iter_cases(params_dir)
+    _check_unique_outputs(cases, out_dir, ymd)
+    cache_dir = Path(args.cache_dir) if args.cache_dir else None
+    digest = _generator_digest() if cache_dir is not None else ""
+
+    job = functools.partial(_run_case, out_dir=out_dir, ymd=ymd, cache_dir=cache_dir, digest=digest)
+    if args.workers == 1 or len(cases) == 1:
+        results = map(job, cases)
+        pool = None
+    else:
+        # Imported lazily: the default in-process run never needs worker processes.
+        from concurrent.futures import ProcessPoolExecutor
 
+        pool = ProcessPoolExecutor(max_workers=args.workers or os.cpu_count())
+        results = pool.map(job, cases)
+
+    # map() yields in case order, so the report is identical however many workers ran.
     failures: List[Tuple[str, str]] = []
-    for c in cases:
-        try:
-            res = generate_svg(c.template_id, c.params)
-            if not isinstance(res, dict):
-                raise TypeError("generate_svg returned non-dict")
-            svg = res.get("svg")
-            warnings = res.get("warnings") or []
-
-            _validate_svg(svg, template_id=c.template_id)
-
-            errors = _find_error_warnings(warnings)
-            if errors:
-                raise ValueError(f"Blocking errors returned: {errors}")
-
-            zip_name = f"CardBoxGen_{c.template_id}_{ymd}.zip"
-            out_path = out_dir / zip_name
-            _write_zip(out_path, svg=svg, template_id=c.template_id, params=c.params, warnings=warnings)
-
-            print(f"OK  {c.template_id} -> {out_path}")
-        except Exception as e:
-            failures.append((c.template_id, str(e)))
-            print(f"FAIL {c.template_id}: {e}", file=sys.stderr)
+    try:
+        for c, (out_path, err) in zip(cases, results):
+            if err is None:
+                print(f"OK  {c.template_id} -> {out_path}")
+            else:
+                failures.append((c.template_id, err))
+                print(f"FAIL {c.template_id}: {err}", file=sys.stderr)
+    finally:
+        if pool is not None:
+            pool.shutdown()
 
     if failures:
         print("\nFailures:", file=sys.stderr)
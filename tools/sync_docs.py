@@ -8,6 +8,7 @@ Run from repo root:
 
 from __future__ import annotations
 
+import filecmp
 import shutil
 from pathlib import Path
 
@@ -21,6 +22,11 @@ def main() -> None:
 
     for src, dst in targets:
         dst.parent.mkdir(parents=True, exist_ok=True)
+        # copy2 keeps the mtime, so an unchanged copy matches on the stat signature
+        # alone; anything else falls back to a byte comparison before re-copying.
+        if dst.exists() and filecmp.cmp(src, dst, shallow=True):
+            print(f"Up-to-date {dst}")
+            continue
         shutil.copy2(src, dst)
         print(f"Synced {src} -> {dst}")
 